@@ -13,14 +13,18 @@ This package provides:
 - Zero external dependencies (Python standard library only)
 """
 
+from typing import TYPE_CHECKING, Any
+
 from .monitoring_schemas import (
     SELLER_MONITORING_EVENTS_SCHEMA,
     SELLER_MONITORING_SCHEMA,
 )
 from .schemas import LISTING_SCHEMA, SELLER_SCHEMA, DataType, SchemaField
-from .test_runner import SchemaTestRunner
 from .validators import CSVSchemaValidator, ValidationIssue, ValidationResult
 
+if TYPE_CHECKING:
+    from .test_runner import SchemaTestRunner
+
 __all__ = [
     # Schema definitions
     "DataType",
@@ -37,3 +41,13 @@ __all__ = [
 ]
 
 __version__ = "1.0.0"
+
+
+def __getattr__(name: str) -> Any:
+    """Import the test runner on first access so schema-only callers skip it."""
+    if name == "SchemaTestRunner":
+        from .test_runner import SchemaTestRunner
+
+        globals()[name] = SchemaTestRunner
+        return SchemaTestRunner
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -40,20 +40,23 @@ def main():
     schema_name = args.schema_type.title()
 
     if args.command == "info":
-        print(f"📋 {schema_name} Schema Information")
-        print("=" * 50)
-        print(f"Total Fields: {len(schema)}")
-        print(f"Required Fields: {sum(1 for field in schema if field.required)}")
-        print(f"Optional Fields: {sum(1 for field in schema if not field.required)}")
-        print("\nFields:")
-
-        for i, field in enumerate(schema, 1):
-            required_marker = "✓" if field.required else "○"
-            nullable_marker = "(nullable)" if field.nullable else ""
-            print(
-                f"  {i:2d}. {required_marker} {field.name:<30} [{field.data_type.value}] {nullable_marker}"
-            )
-
+        required_count = sum(1 for field in schema if field.required)
+
+        lines = [
+            f"📋 {schema_name} Schema Information",
+            "=" * 50,
+            f"Total Fields: {len(schema)}",
+            f"Required Fields: {required_count}",
+            f"Optional Fields: {len(schema) - required_count}",
+            "\nFields:",
+        ]
+        lines.extend(
+            f"  {i:2d}. {'✓' if field.required else '○'} {field.name:<30} "
+            f"[{field.data_type.value}] {'(nullable)' if field.nullable else ''}"
+            for i, field in enumerate(schema, 1)
+        )
+
+        sys.stdout.write("\n".join(lines) + "\n")
         return 0
 
     elif args.command == "validate":
@@ -80,29 +83,29 @@ def main():
         print(f"Execution Time: {result.execution_time_ms:.2f}ms")
 
         if result.issues:
-            print(f"\n🚨 Issues Found ({len(result.issues)} total):")
+            print(f"\n🚨 Issues Found ({result.total_issue_count} total):")
             print(f"  - Errors: {result.error_count}")
             print(f"  - Warnings: {result.warning_count}")
             print(f"  - Info: {result.info_count}")
 
-            # Group issues by severity
-            errors = [issue for issue in result.issues if issue.severity == "error"]
-            warnings = [issue for issue in result.issues if issue.severity == "warning"]
+            # Issues grouped by severity
+            errors = result.errors
+            warnings = result.warnings
 
             if errors:
                 print("\n❌ ERRORS:")
                 for error in errors[:5]:  # Show first 5 errors
                     row_info = f" (row {error.row_number})" if error.row_number else ""
                     print(f"  • {error.field_name}: {error.description}{row_info}")
-                if len(errors) > 5:
-                    print(f"  ... and {len(errors) - 5} more errors")
+                if result.error_count > 5:
+                    print(f"  ... and {result.error_count - 5} more errors")
 
             if warnings:
                 print("\n⚠️  WARNINGS:")
                 for warning in warnings[:3]:  # Show first 3 warnings
                     print(f"  • {warning.field_name}: {warning.description}")
-                if len(warnings) > 3:
-                    print(f"  ... and {len(warnings) - 3} more warnings")
+                if result.warning_count > 3:
+                    print(f"  ... and {result.warning_count - 3} more warnings")
 
         if result.missing_columns:
             print(f"\n🔍 Missing Required Columns ({len(result.missing_columns)}):")
@@ -5,7 +5,7 @@ Integration Helpers
 Helper functions for integrating CSV schema validation into various workflows.
 """
 
-from .ci_cd import GitHubActionsReporter, generate_ci_report
+from .ci_cd import GitHubActionsReporter, generate_ci_report, run_validations
 from .monitoring import ValidationMonitor, send_to_datadog, send_to_prometheus
 from .scrapers import ScraperIntegration, create_post_scraper_hook
 
@@ -15,6 +15,7 @@ __all__ = [
     "send_to_datadog",
     "GitHubActionsReporter",
     "generate_ci_report",
+    "run_validations",
     "ScraperIntegration",
     "create_post_scraper_hook",
 ]
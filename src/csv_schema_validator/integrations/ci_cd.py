@@ -10,9 +10,10 @@ import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Union
 
-from ..validators import ValidationResult
+from ..schemas import SchemaField
+from ..validators import BatchValidator, ValidationIssue, ValidationResult
 
 
 class GitHubActionsReporter:
@@ -22,44 +23,54 @@ class GitHubActionsReporter:
         """Initialize GitHub Actions reporter."""
         self.is_github_actions = os.getenv("GITHUB_ACTIONS") == "true"
 
-    def report_results(self, results: Dict[str, ValidationResult]) -> None:
+    def report_results(
+        self, results: Dict[str, ValidationResult], out: Optional[TextIO] = None
+    ) -> None:
         """
         Report validation results in GitHub Actions format.
 
+        The whole report is assembled in memory and written with a single
+        call, rather than one flushed ``print`` per line.
+
         Args:
             results: Dictionary mapping file paths to validation results
+            out: Stream to write the report to (defaults to ``sys.stdout``)
         """
+        # Looked up per call so redirected stdout still receives the report
+        out = sys.stdout if out is None else out
         total_files = len(results)
         passed_files = sum(1 for r in results.values() if r.is_valid)
         failed_files = total_files - passed_files
 
+        lines: List[str] = []
+
         # Create summary
         if self.is_github_actions:
-            print(
+            lines.append(
                 f"::notice::CSV Validation Summary: {passed_files}/{total_files} files passed"
             )
 
-        print(f"📊 CSV Validation Summary")
-        print(f"  Total Files: {total_files}")
-        print(f"  ✅ Passed: {passed_files}")
-        print(f"  ❌ Failed: {failed_files}")
+        lines.append("📊 CSV Validation Summary")
+        lines.append(f"  Total Files: {total_files}")
+        lines.append(f"  ✅ Passed: {passed_files}")
+        lines.append(f"  ❌ Failed: {failed_files}")
 
         # Report individual file results
         for file_path, result in results.items():
             if result.is_valid:
                 if self.is_github_actions:
-                    print(
+                    lines.append(
                         f"::notice file={file_path}::✅ Validation passed ({result.total_rows} rows)"
                     )
-                print(f"✅ {file_path}: PASSED ({result.total_rows} rows)")
+                lines.append(f"✅ {file_path}: PASSED ({result.total_rows} rows)")
             else:
                 if self.is_github_actions:
-                    print(
+                    lines.append(
                         f"::error file={file_path}::❌ Validation failed - {result.error_count} errors, {result.warning_count} warnings"
                     )
 
-                print(f"❌ {file_path}: FAILED")
-                print(
+                lines.append(f"❌ {file_path}: FAILED")
+                lines.append(
                     f"  Errors: {result.error_count}, Warnings: {result.warning_count}"
                 )
 
@@ -69,18 +80,55 @@ class GitHubActionsReporter:
                         row_info = (
                             f" at line {issue.row_number}" if issue.row_number else ""
                         )
-                        print(
+                        lines.append(
                             f"::error file={file_path}{row_info}::{issue.field_name}: {issue.description}"
                         )
-                    print(f"    - {issue.field_name}: {issue.description}")
+                    lines.append(f"    - {issue.field_name}: {issue.description}")
+
+                if result.issues_truncated:
+                    lines.append(
+                        f"    ... and {result.issues_truncated} more (truncated)"
+                    )
+
+        if failed_files > 0 and self.is_github_actions:
+            lines.append(f"::error::CSV validation failed for {failed_files} files")
+
+        lines.append("")
+        out.write("\n".join(lines))
+        out.flush()
 
         # Exit with error if any validation failed
         if failed_files > 0:
-            if self.is_github_actions:
-                print(f"::error::CSV validation failed for {failed_files} files")
             sys.exit(1)
 
 
+def run_validations(
+    paths: Iterable[Union[str, Path]],
+    schema: List[SchemaField],
+    schema_name: str = "unknown",
+    workers: Optional[int] = None,
+) -> Dict[str, ValidationResult]:
+    """
+    Validate many CSV files, in parallel worker processes when worthwhile.
+
+    A thin wrapper over ``BatchValidator.validate_files``. The returned
+    mapping can be passed straight to ``generate_ci_report`` or
+    ``GitHubActionsReporter.report_results``.
+
+    Args:
+        paths: CSV files to validate
+        schema: Schema definition applied to every file
+        schema_name: Name recorded on each validation result
+        workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        Dict mapping file paths to validation results
+    """
+    return BatchValidator().validate_files(
+        [(path, schema) for path in paths], max_workers=workers, schema_name=schema_name
+    )
+
+
 def generate_ci_report(
     results: Dict[str, ValidationResult], output_path: Path | None = None
 ) -> Dict[str, Any]:
@@ -125,29 +173,19 @@ def generate_ci_report(
             "error_count": result.error_count,
             "warning_count": result.warning_count,
             "execution_time_ms": result.execution_time_ms,
-            "issues": [],
+            "issues": list(map(ValidationIssue.to_dict, result.issues)),
+            "issues_truncated": result.issues_truncated,
         }
 
-        # Add issues details
-        for issue in result.issues:
-            issue_data: Dict[str, Any] = {
-                "field_name": issue.field_name,
-                "issue_type": issue.issue_type,
-                "severity": issue.severity,
-                "description": issue.description,
-                "row_number": issue.row_number,
-                "actual_value": issue.actual_value,
-                "expected_value": issue.expected_value,
-                "suggestion": issue.suggestion,
-            }
-            file_report["issues"].append(issue_data)
-
         report["files"].append(file_report)
 
     # Save to file if requested
     if output_path:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(json.dumps(report, indent=2))
+        # json.dump streams encoder chunks into the buffered file, so the
+        # indented document is never held in memory as one string
+        with output_path.open("w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, indent=2)
         print(f"📄 CI report saved to: {output_path}")
 
     return report
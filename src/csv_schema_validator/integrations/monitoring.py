@@ -5,40 +5,94 @@ Monitoring Integration
 Real-time monitoring and alerting for CSV validation results.
 """
 
+import importlib.util
 import json
 import logging
+import os
+import socket
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from fnmatch import fnmatch
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-# Import optional dependencies
-has_requests = False
-has_schedule = False
+from ..test_runner import (
+    _DEFAULT_DISCOVERY_PATTERNS,
+    _EXCLUDED_PATH_PARTS,
+    SchemaTestRunner,
+)
+from ..validators import _UNCACHEABLE_ISSUE_TYPES, ValidationIssue, ValidationResult
 
-try:
-    import requests  # type: ignore
+# (schema type, file name pattern) pairs the monitor validates: the test
+# runner's recursive default discovery patterns without their "**/" prefix
+_MONITORED_FILE_PATTERNS = tuple(
+    (schema_type, pattern.removeprefix("**/"))
+    for schema_type, pattern in _DEFAULT_DISCOVERY_PATTERNS.items()
+)
 
-    has_requests = True
-except ImportError:
-    pass
+# Keep DogStatsD datagrams within a typical network MTU
+_DOGSTATSD_MAX_PACKET = 1432
 
-try:
-    import schedule  # type: ignore
+# Characters that delimit DogStatsD tags, fields or (newlines) whole metrics
+_DOGSTATSD_TAG_DELIMITERS = str.maketrans(dict.fromkeys(",|\n\r", "_"))
 
-    has_schedule = True
-except ImportError:
-    pass
+# Shared HTTP session so metric pushes reuse pooled keep-alive connections
+_http_session: Optional[Any] = None
 
-from ..test_runner import SchemaTestRunner
-from ..validators import ValidationResult
+
+@cache
+def _has_requests() -> bool:
+    """Check once whether the optional requests library is installed."""
+    return importlib.util.find_spec("requests") is not None
+
+
+def _get_http_session() -> Any:
+    """Return the shared requests session, importing requests on first use."""
+    global _http_session
+
+    if _http_session is None:
+        import requests  # type: ignore
+        from requests.adapters import HTTPAdapter  # type: ignore
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _http_session = session
+
+    return _http_session
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Serialize an alert payload to compact JSON.
+
+    Issues are converted with ``ValidationIssue.to_dict`` as the encoder
+    reaches them, so no intermediate list of dicts is built up front. Alert
+    payloads are plain trees, so the encoder's circular-reference bookkeeping
+    is skipped.
+    """
+    return json.dumps(
+        obj,
+        separators=(",", ":"),
+        check_circular=False,
+        default=ValidationIssue.to_dict,
+    )
 
 
 class ValidationMonitor:
     """Real-time validation monitoring system."""
 
     def __init__(
-        self, base_directory: str = "./scrapers", monitoring_interval: int = 60
+        self,
+        base_directory: str = "./scrapers",
+        monitoring_interval: int = 60,
+        cache_size: int = 10_000,
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize validation monitor.
@@ -46,154 +100,358 @@ class ValidationMonitor:
         Args:
             base_directory: Directory to monitor for CSV files
             monitoring_interval: Check interval in minutes
+            cache_size: Maximum number of per-file results kept between checks
+            max_workers: Threads used to validate changed files (defaults to
+                the ThreadPoolExecutor default)
+
+        Raises:
+            ValueError: If ``monitoring_interval`` is not positive
         """
+        # A zero interval would re-run checks back to back with no wait
+        if monitoring_interval <= 0:
+            raise ValueError(
+                f"monitoring_interval must be positive, got {monitoring_interval}"
+            )
+
         self.base_directory = Path(base_directory)
         self.monitoring_interval = monitoring_interval
         self.runner = SchemaTestRunner(workspace_root=str(self.base_directory))
         self.logger = logging.getLogger(__name__)
 
+        # file path -> (st_mtime_ns, st_size, result), least recently used first
+        self.cache_size = cache_size
+        self._result_cache: OrderedDict[str, Tuple[int, int, ValidationResult]] = (
+            OrderedDict()
+        )
+
+        # Validating changed files concurrently overlaps their file reads
+        self._max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+
+        # Set by stop() to end start_monitoring without waiting out a sleep
+        self._stop_event = threading.Event()
+
     def start_monitoring(self) -> None:
-        """Start continuous monitoring of CSV files."""
-        if has_schedule:
-            schedule.every(self.monitoring_interval).minutes.do(  # type: ignore
-                self._run_validation_check
-            )
-            self.logger.info(
-                f"Started CSV validation monitoring every {self.monitoring_interval} minutes"
-            )
-            while True:
-                schedule.run_pending()  # type: ignore
-                time.sleep(60)
-        else:
-            self.logger.warning(
-                "Schedule library not available, running validation once"
-            )
-            self._run_validation_check()
+        """
+        Start continuous monitoring of CSV files.
+
+        The loop sleeps until the next check is due instead of polling, and
+        deadlines advance on the monotonic clock so checks don't drift. If a
+        check overruns its interval, the missed slots are skipped rather than
+        run back to back. The wait is interrupted as soon as ``stop`` is
+        called, and once the loop ends the worker pool is shut down, dropping
+        any metric pushes still queued.
+        """
+        interval_seconds = self.monitoring_interval * 60
+        self.logger.info(
+            "Started CSV validation monitoring every %d minutes",
+            self.monitoring_interval,
+        )
+
+        self._stop_event.clear()
+        next_run = time.monotonic()
+        try:
+            while not self._stop_event.is_set():
+                self._run_validation_check()
+                next_run += interval_seconds
+
+                now = time.monotonic()
+                if next_run < now:
+                    missed = (now - next_run) // interval_seconds + 1
+                    next_run += missed * interval_seconds
+                self._stop_event.wait(max(0.0, next_run - now))
+        finally:
+            # Don't leave worker threads behind the monitor; the replacement
+            # pool starts no threads until a later check uses it
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = ThreadPoolExecutor(max_workers=self._max_workers)
+
+        self.logger.info("Stopped CSV validation monitoring")
+
+    def stop(self) -> None:
+        """
+        Stop a running ``start_monitoring`` loop.
+
+        Safe to call from another thread or a signal handler; the loop exits
+        after the check in progress, if any, finishes.
+        """
+        self._stop_event.set()
 
     def _run_validation_check(self) -> None:
-        """Run validation check on all CSV files."""
+        """
+        Run validation check on all CSV files.
+
+        Failing results are pushed to the external monitoring systems in one
+        batch per check rather than one request per file, and every alert in
+        a check shares one timestamp.
+        """
         try:
-            results = self.runner.run_full_validation()
+            results = self._validate_changed_files()
+            failing: Dict[str, ValidationResult] = {}
+            check_timestamp = datetime.now().isoformat()
 
             for file_path, result in results.items():
                 if not result.is_valid:
-                    self._send_alert(file_path, result)
+                    failing[file_path] = result
+                    self._send_alert(file_path, result, check_timestamp)
                     self._log_validation_failure(result)
                 else:
                     self._log_validation_success(result)
+
+            if failing:
+                # Overlap the Prometheus HTTP push with the DataDog UDP send
+                prometheus_push = self._pool.submit(send_to_prometheus, failing)
+                send_to_datadog(failing)
+                prometheus_push.result()
         except Exception as e:
-            self.logger.error(f"Error during validation check: {e}")
+            self.logger.error("Error during validation check: %s", e)
 
-    def _send_alert(self, file_path: str, result: ValidationResult) -> None:
-        """Send alert for validation failure."""
-        alert_data: Dict[str, Any] = {
-            "timestamp": datetime.now().isoformat(),
-            "file_path": file_path,
-            "validation_issues": [issue.__dict__ for issue in result.issues],
-            "error_count": result.error_count,
-            "warning_count": result.warning_count,
-            "total_rows": result.total_rows,
-        }
+    def _iter_csv_files(self) -> Iterator[Tuple[str, str, os.stat_result]]:
+        """
+        Yield ``(schema_type, path, stat)`` for every monitored CSV file.
 
-        self.logger.warning(f"Validation failure alert: {json.dumps(alert_data)}")
+        This walks the tree with ``os.scandir`` and reuses each entry's stat
+        result, instead of globbing once per schema type and then stat-ing
+        every match. It selects the same files as the test runner's default
+        discovery patterns.
+        """
+        root = str(self.base_directory)
+        if any(part in root for part in _EXCLUDED_PATH_PARTS):
+            return
 
-        # Send to external monitoring systems
-        send_to_prometheus({"file_path": result})
-        send_to_datadog({"file_path": result})
+        stack = [root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if not any(
+                                    part in entry.path for part in _EXCLUDED_PATH_PARTS
+                                ):
+                                    stack.append(entry.path)
+                                continue
+
+                            if any(part in entry.name for part in _EXCLUDED_PATH_PARTS):
+                                continue
+
+                            # fnmatch normalizes case as the runner's matching does
+                            for schema_type, pattern in _MONITORED_FILE_PATTERNS:
+                                if fnmatch(entry.name, pattern):
+                                    if entry.is_file():
+                                        yield schema_type, entry.path, entry.stat()
+                                    break
+                        except OSError:
+                            continue  # Entry vanished or is unreadable
+            except OSError:
+                continue
+
+    def _validate_changed_files(self) -> Dict[str, ValidationResult]:
+        """
+        Validate discovered CSV files, reusing results for unchanged files.
+
+        A file is considered unchanged when its modification time and size
+        match the values recorded when its cached result was produced. Changed
+        files are validated concurrently on the monitor's thread pool. Results
+        from files that could not be read or parsed are not cached, so those
+        files are retried on the next check.
+        """
+        results: Dict[str, ValidationResult] = {}
+        stale: List[Tuple[str, str, os.stat_result]] = []
+
+        for schema_type, file_key, stat in self._iter_csv_files():
+            cached = self._result_cache.get(file_key)
+            if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                self._result_cache.move_to_end(file_key)
+                results[file_key] = cached[2]
+                continue
+
+            stale.append((file_key, schema_type, stat))
+
+        validated = self._pool.map(
+            self.runner.run_single_file_validation,
+            [file_key for file_key, _, _ in stale],
+            [schema_type for _, schema_type, _ in stale],
+        )
+        for (file_key, _, stat), result in zip(stale, validated):
+            results[file_key] = result
+            if any(
+                issue.issue_type in _UNCACHEABLE_ISSUE_TYPES for issue in result.issues
+            ):
+                self._result_cache.pop(file_key, None)
+                continue
+
+            self._result_cache[file_key] = (stat.st_mtime_ns, stat.st_size, result)
+            self._result_cache.move_to_end(file_key)
+            if len(self._result_cache) > self.cache_size:
+                self._result_cache.popitem(last=False)
+
+        return results
+
+    def _send_alert(
+        self, file_path: str, result: ValidationResult, timestamp: Optional[str] = None
+    ) -> None:
+        """Log an alert for a validation failure."""
+        # Skip building and serializing the payload when warnings are filtered
+        if self.logger.isEnabledFor(logging.WARNING):
+            alert_data: Dict[str, Any] = {
+                "timestamp": timestamp or datetime.now().isoformat(),
+                "file_path": file_path,
+                "validation_issues": result.issues,
+                "error_count": result.error_count,
+                "warning_count": result.warning_count,
+                "total_rows": result.total_rows,
+            }
+
+            self.logger.warning("Validation failure alert: %s", _dumps(alert_data))
 
     def _log_validation_success(self, result: ValidationResult) -> None:
         """Log successful validation."""
         self.logger.info(
-            f"CSV validation passed: {result.file_path} "
-            f"({result.total_rows} rows, {result.total_columns} columns)"
+            "CSV validation passed: %s (%d rows, %d columns)",
+            result.file_path,
+            result.total_rows,
+            result.total_columns,
         )
 
     def _log_validation_failure(self, result: ValidationResult) -> None:
         """Log validation failure with details."""
         self.logger.error(
-            f"CSV validation failed: {result.file_path} "
-            f"- {result.error_count} errors, {result.warning_count} warnings"
+            "CSV validation failed: %s - %d errors, %d warnings",
+            result.file_path,
+            result.error_count,
+            result.warning_count,
         )
 
 
+def _iter_metrics(
+    validation_results: Dict[str, ValidationResult],
+) -> Iterator[Tuple[str, int, Dict[str, str]]]:
+    """
+    Yield ``(metric, value, labels)`` for every validation result.
+
+    Both the Prometheus and DataDog senders build their payloads from these
+    tuples. Neither wire format carries a client-side timestamp, so none is
+    taken here.
+    """
+    for file_path, result in validation_results.items():
+        labels = {"file_path": file_path, "schema_type": result.schema_name}
+        yield (
+            "csv_validation_status",
+            int(result.is_valid),
+            {**labels, "error_count": str(result.error_count)},
+        )
+        yield ("csv_validation_errors", result.error_count, labels)
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value for the Prometheus text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_prometheus_metrics(validation_results: Dict[str, ValidationResult]) -> str:
+    """
+    Render validation metrics in the Prometheus text exposition format.
+
+    Samples are grouped under a ``# TYPE`` line per metric, as the format
+    requires. Timestamps are omitted because the pushgateway rejects them.
+    """
+    samples: Dict[str, List[str]] = {}
+    for metric, value, labels in _iter_metrics(validation_results):
+        label_text = ",".join(
+            f'{name}="{_escape_label_value(label)}"' for name, label in labels.items()
+        )
+        samples.setdefault(metric, []).append(f"{metric}{{{label_text}}} {value}")
+
+    lines: List[str] = []
+    for metric, metric_samples in samples.items():
+        lines.append(f"# TYPE {metric} gauge")
+        lines.extend(metric_samples)
+    lines.append("")
+    return "\n".join(lines)
+
+
 def send_to_prometheus(validation_results: Dict[str, ValidationResult]) -> None:
-    """Send validation metrics to Prometheus."""
+    """Send validation metrics to the Prometheus pushgateway."""
     try:
-        if not has_requests:
+        if not _has_requests():
             logging.warning("Requests library not available, cannot send to Prometheus")
             return
 
-        import requests
-
-        metrics: List[Dict[str, Any]] = []
-
-        for file_path, result in validation_results.items():
-            metric_entry: Dict[str, Any] = {
-                "metric": "csv_validation_status",
-                "value": 1 if result.is_valid else 0,
-                "labels": {
-                    "file_path": file_path,
-                    "schema_type": result.schema_name,
-                    "error_count": str(result.error_count),
-                },
-                "timestamp": datetime.now().isoformat(),
-            }
-            metrics.append(metric_entry)
-
-            error_metric: Dict[str, Any] = {
-                "metric": "csv_validation_errors",
-                "value": result.error_count,
-                "labels": {
-                    "file_path": file_path,
-                    "schema_type": result.schema_name,
-                },
-                "timestamp": datetime.now().isoformat(),
-            }
-            metrics.append(error_metric)
+        payload = _format_prometheus_metrics(validation_results)
 
         # Send to Prometheus pushgateway (if available)
-        prometheus_url = "http://pushgateway:9091/metrics"
-        response = requests.post(prometheus_url, json=metrics, timeout=10)
+        prometheus_url = "http://pushgateway:9091/metrics/job/csv_schema_validator"
+        response = _get_http_session().post(
+            prometheus_url,
+            data=payload.encode("utf-8"),
+            headers={"Content-Type": "text/plain; version=0.0.4"},
+            timeout=10,
+        )
 
         if response.status_code == 200:
             logging.info("Successfully sent metrics to Prometheus")
         else:
             logging.warning(
-                f"Failed to send metrics to Prometheus: {response.status_code}"
+                "Failed to send metrics to Prometheus: %s", response.status_code
             )
 
     except ImportError:
         logging.warning("requests not available - skipping Prometheus integration")
     except Exception as e:
-        logging.error(f"Error sending metrics to Prometheus: {e}")
+        logging.error("Error sending metrics to Prometheus: %s", e)
+
+
+def _dogstatsd_tag(value: str) -> str:
+    """Replace characters that delimit DogStatsD tags, fields or metrics."""
+    return value.translate(_DOGSTATSD_TAG_DELIMITERS)
 
 
 def send_to_datadog(validation_results: Dict[str, ValidationResult]) -> None:
-    """Send validation metrics to DataDog."""
+    """
+    Send validation metrics to DataDog.
+
+    Gauges are written in the DogStatsD line protocol and packed into as few
+    UDP datagrams as fit under ``_DOGSTATSD_MAX_PACKET`` bytes. The agent
+    address comes from ``DD_AGENT_HOST`` and ``DD_DOGSTATSD_PORT``.
+    """
     try:
-        # Mock DataDog integration - replace with actual DataDog client
-        for file_path, result in validation_results.items():
-            # statsd.gauge('csv.validation.status',
-            #             1 if result.is_valid else 0,
-            #             tags=[f'file:{file_path}', f'schema:{result.schema_name}'])
-
-            # statsd.gauge('csv.validation.errors',
-            #             result.error_count,
-            #             tags=[f'file:{file_path}', f'schema:{result.schema_name}'])
-
-            logging.info(
-                f"DataDog metrics: csv.validation.status={1 if result.is_valid else 0}, "
-                f"csv.validation.errors={result.error_count} "
-                f"[file:{file_path}, schema:{result.schema_name}]"
+        address = (
+            os.getenv("DD_AGENT_HOST", "localhost"),
+            int(os.getenv("DD_DOGSTATSD_PORT", "8125")),
+        )
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+
+        packets: List[bytes] = []
+        lines: List[bytes] = []
+        size = 0
+        for metric, value, labels in _iter_metrics(validation_results):
+            line = (
+                f"{metric.replace('_', '.')}:{value}|g"
+                f"|#file:{_dogstatsd_tag(labels['file_path'])}"
+                f",schema:{_dogstatsd_tag(labels['schema_type'])}"
             )
+            if debug:
+                logging.debug("DataDog metrics: %s", line)
+
+            encoded = line.encode("utf-8")
+            if lines and size + len(encoded) + 1 > _DOGSTATSD_MAX_PACKET:
+                packets.append(b"\n".join(lines))
+                lines, size = [], 0
+            lines.append(encoded)
+            size += len(encoded) + 1
+        if lines:
+            packets.append(b"\n".join(lines))
+
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            for packet in packets:
+                sock.sendto(packet, address)
 
     except Exception as e:
-        logging.error(f"Error sending metrics to DataDog: {e}")
+        logging.error("Error sending metrics to DataDog: %s", e)
 
 
-def create_monitoring_dashboard() -> str:
-    """Create a simple monitoring dashboard."""
-    dashboard_html = """
+_DASHBOARD_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -244,4 +502,7 @@ def create_monitoring_dashboard() -> str:
     </html>
     """
 
-    return dashboard_html
+
+def create_monitoring_dashboard() -> str:
+    """Create a simple monitoring dashboard."""
+    return _DASHBOARD_HTML
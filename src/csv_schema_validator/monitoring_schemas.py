@@ -190,13 +190,15 @@ SELLER_MONITORING_EVENTS_SCHEMA = [
 ]
 
 
+_MONITORING_SCHEMAS: Dict[str, List[SchemaField]] = {
+    "seller_monitoring": SELLER_MONITORING_SCHEMA,
+    "seller_monitoring_events": SELLER_MONITORING_EVENTS_SCHEMA,
+}
+
+
 def get_monitoring_schema_by_name(schema_name: str) -> List[SchemaField]:
     """Get monitoring schema definition by name."""
-    schemas = {
-        "seller_monitoring": SELLER_MONITORING_SCHEMA,
-        "seller_monitoring_events": SELLER_MONITORING_EVENTS_SCHEMA,
-    }
-    return schemas.get(schema_name.lower(), [])
+    return _MONITORING_SCHEMAS.get(schema_name.lower(), [])
 
 
 def get_monitoring_column_names(schema: List[SchemaField]) -> List[str]:
@@ -209,30 +211,28 @@ def get_monitoring_required_columns(schema: List[SchemaField]) -> List[str]:
     return [field.name for field in schema if field.required and not field.nullable]
 
 
-def get_monitoring_schema_info() -> Dict[str, Dict[str, Any]]:
-    """Get comprehensive information about monitoring schemas."""
+def _build_schema_info(schema: List[SchemaField]) -> Dict[str, Any]:
+    """Summarize a monitoring schema's columns and data types."""
     return {
-        "seller_monitoring": {
-            "total_columns": len(SELLER_MONITORING_SCHEMA),
-            "required_columns": len(
-                get_monitoring_required_columns(SELLER_MONITORING_SCHEMA)
-            ),
-            "column_names": get_monitoring_column_names(SELLER_MONITORING_SCHEMA),
-            "data_types": {
-                field.name: field.data_type.value for field in SELLER_MONITORING_SCHEMA
-            },
-        },
-        "seller_monitoring_events": {
-            "total_columns": len(SELLER_MONITORING_EVENTS_SCHEMA),
-            "required_columns": len(
-                get_monitoring_required_columns(SELLER_MONITORING_EVENTS_SCHEMA)
-            ),
-            "column_names": get_monitoring_column_names(
-                SELLER_MONITORING_EVENTS_SCHEMA
-            ),
-            "data_types": {
-                field.name: field.data_type.value
-                for field in SELLER_MONITORING_EVENTS_SCHEMA
-            },
-        },
+        "total_columns": len(schema),
+        "required_columns": len(get_monitoring_required_columns(schema)),
+        "column_names": get_monitoring_column_names(schema),
+        "data_types": {field.name: field.data_type.value for field in schema},
     }
+
+
+# The schemas are module constants, so their summaries are built once
+_SCHEMA_INFO: Dict[str, Dict[str, Any]] = {
+    "seller_monitoring": _build_schema_info(SELLER_MONITORING_SCHEMA),
+    "seller_monitoring_events": _build_schema_info(SELLER_MONITORING_EVENTS_SCHEMA),
+}
+
+
+def get_monitoring_schema_info() -> Dict[str, Dict[str, Any]]:
+    """
+    Get comprehensive information about monitoring schemas.
+
+    The returned mapping is computed at import time and shared between
+    callers; treat it as read-only.
+    """
+    return _SCHEMA_INFO
@@ -6,9 +6,10 @@ This module defines the expected schemas for all CSV output files
 across the tereo scraping ecosystem.
 """
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Pattern
 
 
 class DataType(Enum):
@@ -26,7 +27,12 @@ class DataType(Enum):
     EMAIL = "email"
 
 
-@dataclass
+# For UUID and other auto-generated fields, we don't require a default value
+# since they are generated during data creation
+_AUTO_GENERATED_TYPES = frozenset({DataType.UUID, DataType.DATETIME})
+
+
+@dataclass(slots=True)
 class SchemaField:
     """Defines a single CSV column field with validation rules."""
 
@@ -38,23 +44,29 @@ class SchemaField:
     format_pattern: Optional[str] = None
     description: Optional[str] = None
     examples: Optional[List[str]] = None
+    # format_pattern compiled once per field; None if absent or invalid
+    compiled_pattern: Optional[Pattern[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Post-initialization validation."""
-        # For UUID and other auto-generated fields, we don't require a default value
-        # since they are generated during data creation
-        auto_generated_types = {DataType.UUID, DataType.DATETIME}
-
         if (
             not self.nullable
             and self.required
             and self.default_value is None
-            and self.data_type not in auto_generated_types
+            and self.data_type not in _AUTO_GENERATED_TYPES
         ):
             raise ValueError(
                 f"Field '{self.name}' is required and non-nullable but has no default value"
             )
 
+        if self.format_pattern:
+            try:
+                self.compiled_pattern = re.compile(self.format_pattern)
+            except re.error:
+                pass  # Validators fall back to the common datetime formats
+
 
 # Seller CSV Schema Definition
 # Based on analysis of actual CSV files and code patterns across scrapers
@@ -606,19 +618,21 @@ LISTING_SCHEMA = [
 ]
 
 
+_SCHEMAS: Dict[str, List[SchemaField]] = {
+    "seller": SELLER_SCHEMA,
+    "listing": LISTING_SCHEMA,
+}
+
+
 def get_schema_by_name(schema_name: str) -> List[SchemaField]:
     """Get schema definition by name."""
-    schemas = {
-        "seller": SELLER_SCHEMA,
-        "listing": LISTING_SCHEMA,
-    }
-
-    if schema_name.lower() not in schemas:
+    schema = _SCHEMAS.get(schema_name.lower())
+    if schema is None:
         raise ValueError(
-            f"Unknown schema: {schema_name}. Available: {list(schemas.keys())}"
+            f"Unknown schema: {schema_name}. Available: {list(_SCHEMAS.keys())}"
         )
 
-    return schemas[schema_name.lower()]
+    return schema
 
 
 def get_column_names(schema: List[SchemaField]) -> List[str]:
@@ -631,23 +645,27 @@ def get_required_columns(schema: List[SchemaField]) -> List[str]:
     return [field.name for field in schema if field.required]
 
 
-def get_schema_info() -> Dict[str, Dict[str, Any]]:
-    """Get comprehensive information about all schemas."""
+def _build_schema_info(schema: List[SchemaField]) -> Dict[str, Any]:
+    """Summarize a schema's columns and data types."""
     return {
-        "seller": {
-            "total_columns": len(SELLER_SCHEMA),
-            "required_columns": len(get_required_columns(SELLER_SCHEMA)),
-            "column_names": get_column_names(SELLER_SCHEMA),
-            "data_types": {
-                field.name: field.data_type.value for field in SELLER_SCHEMA
-            },
-        },
-        "listing": {
-            "total_columns": len(LISTING_SCHEMA),
-            "required_columns": len(get_required_columns(LISTING_SCHEMA)),
-            "column_names": get_column_names(LISTING_SCHEMA),
-            "data_types": {
-                field.name: field.data_type.value for field in LISTING_SCHEMA
-            },
-        },
+        "total_columns": len(schema),
+        "required_columns": len(get_required_columns(schema)),
+        "column_names": get_column_names(schema),
+        "data_types": {field.name: field.data_type.value for field in schema},
     }
+
+
+# The schemas are module constants, so their summaries are built once
+_SCHEMA_INFO: Dict[str, Dict[str, Any]] = {
+    name: _build_schema_info(schema) for name, schema in _SCHEMAS.items()
+}
+
+
+def get_schema_info() -> Dict[str, Dict[str, Any]]:
+    """
+    Get comprehensive information about all schemas.
+
+    The returned mapping is computed at import time and shared between
+    callers; treat it as read-only.
+    """
+    return _SCHEMA_INFO
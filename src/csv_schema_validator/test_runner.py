@@ -6,22 +6,128 @@ Automated test runner for continuous schema validation across all scrapers.
 Includes test discovery, execution, reporting, and CI/CD integration.
 """
 
+import hashlib
+import heapq
 import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+from dataclasses import fields
 from datetime import datetime
+from fnmatch import translate
+from html import escape
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, TextIO, Tuple, Union
 
 from .schemas import LISTING_SCHEMA, SELLER_SCHEMA, SchemaField
-from .validators import BatchValidator, ValidationResult
+from .validators import (
+    _UNCACHEABLE_ISSUE_TYPES,
+    _VALIDATION_LOGIC_VERSION,
+    BatchValidator,
+    CSVSchemaValidator,
+    ValidationIssue,
+    ValidationResult,
+)
+
+# Types json can encode as-is, so _make_serializable returns them untouched
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+_DEFAULT_DISCOVERY_PATTERNS = {
+    "seller": "**/Seller_rows*.csv",
+    "listing": "**/Listing_rows*.csv",
+}
+
+# Paths containing any of these are skipped during discovery
+_EXCLUDED_PATH_PARTS = ("test_results", "__pycache__")
+
+_SCHEMA_BY_NAME: Dict[str, List[SchemaField]] = {
+    "seller": SELLER_SCHEMA,
+    "listing": LISTING_SCHEMA,
+}
+
+# Static part of the HTML report, ahead of the per-run content
+_HTML_REPORT_HEAD = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Schema Validation Report</title>
+            <style>
+                body { font-family: Arial, sans-serif; margin: 40px; }
+                .header { background: #f4f4f4; padding: 20px; border-radius: 5px; }
+                .summary { margin: 20px 0; }
+                .passed { color: #28a745; }
+                .failed { color: #dc3545; }
+                .warning { color: #ffc107; }
+                table { border-collapse: collapse; width: 100%; margin: 20px 0; }
+                th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+                th { background-color: #f2f2f2; }
+            </style>
+        </head>
+        <body>
+"""
+
+# Per-file validation results persisted in the workspace between runs
+_RESULT_CACHE_FILE = ".schema_validation_cache.json"
+_RESULT_CACHE_SIZE = 10_000
+
+_RESULT_FIELD_NAMES = tuple(f.name for f in fields(ValidationResult) if f.init)
 
 
 def get_schema_by_name(schema_name: str) -> Optional[List[SchemaField]]:
     """Get schema by name."""
-    schemas = {
-        "seller": SELLER_SCHEMA,
-        "listing": LISTING_SCHEMA,
-    }
-    return schemas.get(schema_name.lower())
+    return _SCHEMA_BY_NAME.get(schema_name.lower())
+
+
+def _schema_digest(schema: List[SchemaField]) -> str:
+    """Stable digest of a schema definition, for result cache keys."""
+    return hashlib.sha256(repr(schema).encode("utf-8")).hexdigest()
+
+
+def _file_fingerprint(file_path: Path, schema_digest: str) -> Optional[List[Any]]:
+    """Fingerprint a file's contents and schema; None if it can't be stat-ed."""
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size, schema_digest]
+
+
+def _result_to_cache(result: ValidationResult) -> Dict[str, Any]:
+    """Convert a validation result to its JSON cache form."""
+    data = {name: getattr(result, name) for name in _RESULT_FIELD_NAMES}
+    data["issues"] = [issue.to_dict() for issue in result.issues]
+    data["validation_timestamp"] = result.validation_timestamp.isoformat()
+    return data
+
+
+def _result_from_cache(data: Dict[str, Any]) -> ValidationResult:
+    """Rebuild a validation result from its JSON cache form."""
+    return ValidationResult(
+        **{
+            **data,
+            "issues": [ValidationIssue(**issue) for issue in data["issues"]],
+            "validation_timestamp": datetime.fromisoformat(
+                data["validation_timestamp"]
+            ),
+        }
+    )
+
+
+def _cached_result(entry: Any, fingerprint: List[Any]) -> Optional[ValidationResult]:
+    """
+    Rebuild a cached result if its entry matches ``fingerprint``.
+
+    Returns None for a stale entry, and for a malformed one (e.g. from a
+    hand-edited or partially written cache file) so the file is revalidated.
+    """
+    if not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint:
+        return None
+    try:
+        return _result_from_cache(entry["result"])
+    except (KeyError, TypeError, ValueError):
+        return None
 
 
 class SchemaTestRunner:
@@ -32,6 +138,9 @@ class SchemaTestRunner:
         self.workspace_root = Path(workspace_root)
         self.batch_validator = BatchValidator()
         self.test_results: Dict[str, Any] = {}
+        self._cache_path = self.workspace_root / _RESULT_CACHE_FILE
+        self._result_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._validators: Dict[str, CSVSchemaValidator] = {}
 
     def discover_csv_files(
         self, patterns: Optional[Dict[str, str]] = None
@@ -46,22 +155,48 @@ class SchemaTestRunner:
             Dict mapping schema types to lists of discovered files
         """
         if patterns is None:
-            patterns = {
-                "seller": "**/Seller_rows*.csv",
-                "listing": "**/Listing_rows*.csv",
-            }
+            patterns = _DEFAULT_DISCOVERY_PATTERNS
+
+        discovered_files: dict[str, List[Path]] = {
+            schema_type: [] for schema_type in patterns
+        }
 
-        discovered_files: dict[str, List[Path]] = {}
+        # Filter out files in test directories that might be temporary
+        root = str(self.workspace_root)
+        if any(part in root for part in _EXCLUDED_PATH_PARTS):
+            return discovered_files
+
+        # Recursive name patterns ("**/<name>") are matched in a single walk
+        # that prunes excluded directories; anything else goes through glob
+        name_patterns = {
+            schema_type: re.compile(translate(os.path.normcase(pattern[3:]))).match
+            for schema_type, pattern in patterns.items()
+            if pattern.startswith("**/") and "/" not in pattern[3:]
+        }
+
+        if name_patterns:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [
+                    d
+                    for d in dirnames
+                    if not any(part in d for part in _EXCLUDED_PATH_PARTS)
+                ]
+                for name in filenames:
+                    if any(part in name for part in _EXCLUDED_PATH_PARTS):
+                        continue
+                    normalized = os.path.normcase(name)
+                    for schema_type, matches in name_patterns.items():
+                        if matches(normalized):
+                            discovered_files[schema_type].append(Path(dirpath, name))
 
         for schema_type, pattern in patterns.items():
-            files = list(self.workspace_root.glob(pattern))
-            # Filter out files in test directories that might be temporary
-            files = [
+            if schema_type in name_patterns:
+                continue
+            discovered_files[schema_type] = [
                 f
-                for f in files
-                if "test_results" not in str(f) and "__pycache__" not in str(f)
+                for f in self.workspace_root.glob(pattern)
+                if not any(part in str(f) for part in _EXCLUDED_PATH_PARTS)
             ]
-            discovered_files[schema_type] = files
 
         return discovered_files
 
@@ -69,13 +204,19 @@ class SchemaTestRunner:
         """
         Run complete validation across all discovered CSV files.
 
+        Results for files unchanged since an earlier run are reused from the
+        workspace result cache, which is saved again at the end of the run.
+        Reused results keep the ``validation_timestamp`` and
+        ``execution_time_ms`` of the run that produced them; the summary's
+        ``cached_files`` counts how many results were reused.
+
         Args:
             include_warnings: Whether to include warnings in failure criteria
 
         Returns:
             Comprehensive test results dictionary
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         print("🔍 Starting Schema Validation Tests")
         print("=" * 60)
 
@@ -90,42 +231,96 @@ class SchemaTestRunner:
 
         # Run validation for each schema type
         all_results: Dict[str, ValidationResult] = {}
-        schema_mapping = {
-            "seller": SELLER_SCHEMA,
-            "listing": LISTING_SCHEMA,
-        }
+
+        # Collect every file up front so the whole batch can be validated in
+        # parallel rather than one schema type at a time. Files whose
+        # fingerprint matches the result cache are not revalidated.
+        result_cache = self._get_result_cache()
+        files_by_type: Dict[str, List[Path]] = {}
+        file_schema_pairs: List[Tuple[Path, List[SchemaField]]] = []
+        fingerprints: Dict[str, Optional[List[Any]]] = {}
 
         for schema_type, files in discovered_files.items():
             if not files:
                 continue
 
-            print(f"\n📋 Validating {schema_type} files ({len(files)} files)...")
-            schema = schema_mapping.get(schema_type, [])
+            schema = _SCHEMA_BY_NAME.get(schema_type, [])
 
             if not schema:
                 print(f"❌ No schema definition found for type: {schema_type}")
                 continue
 
-            # Create file-schema pairs for batch validation
-            file_schema_pairs = [(file_path, schema) for file_path in files]
-            results = self.batch_validator.validate_files(file_schema_pairs)  # type: ignore
+            files_by_type[schema_type] = files
+            digest = _schema_digest(schema)
+
+            for file_path in files:
+                key = str(file_path)
+                fingerprint = _file_fingerprint(file_path, digest)
+                entry = result_cache.pop(key, None)
+                cached = None
+                if entry is not None and fingerprint is not None:
+                    cached = _cached_result(entry, fingerprint)
+
+                if cached is not None:
+                    # Re-insert so the most recently used entries are evicted last
+                    result_cache[key] = entry
+                    all_results[key] = cached
+                else:
+                    fingerprints[key] = fingerprint
+                    file_schema_pairs.append((file_path, schema))
+
+        cached_files = len(all_results)
+        validated = self.batch_validator.validate_files(file_schema_pairs)  # type: ignore
+        for key, result in validated.items():
+            # Read failures may be transient, so they are always retried
+            if fingerprints[key] is not None and not any(
+                issue.issue_type in _UNCACHEABLE_ISSUE_TYPES for issue in result.issues
+            ):
+                result_cache[key] = {
+                    "fingerprint": fingerprints[key],
+                    "result": _result_to_cache(result),
+                }
+        all_results.update(validated)
+
+        while len(result_cache) > _RESULT_CACHE_SIZE:
+            del result_cache[next(iter(result_cache))]
+        self._save_result_cache()
+
+        # Report results in discovery order, wherever they came from
+        all_results = {
+            str(file_path): all_results[str(file_path)]
+            for files in files_by_type.values()
+            for file_path in files
+        }
 
-            all_results.update(results)
+        lines: List[str] = []
+        for schema_type, files in files_by_type.items():
+            lines.append(f"\n📋 Validating {schema_type} files ({len(files)} files)...")
+            results = [all_results[str(file_path)] for file_path in files]
 
             # Print summary for this schema type
-            passed = sum(1 for r in results.values() if r.is_valid)
+            passed = sum(1 for r in results if r.is_valid)
             failed = len(results) - passed
 
-            print(f"   ✅ Passed: {passed}")
-            print(f"   ❌ Failed: {failed}")
+            lines.append(f"   ✅ Passed: {passed}")
+            lines.append(f"   ❌ Failed: {failed}")
+
+        if cached_files:
+            lines.append(
+                f"\n♻️  Reused cached results for {cached_files} unchanged files"
+            )
+
+        if lines:
+            lines.append("")
+            sys.stdout.write("\n".join(lines))
 
         # Generate comprehensive results
-        end_time = datetime.now()
-        execution_time = (end_time - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
 
         test_summary = self._generate_test_summary(
-            all_results, execution_time, include_warnings
+            all_results, execution_time, include_warnings, timestamp=datetime.now()
         )
+        test_summary["cached_files"] = cached_files
 
         # Print final summary
         self._print_final_summary(test_summary)
@@ -152,12 +347,7 @@ class SchemaTestRunner:
 
         print(f"🔍 Validating CSV files in: {directory}")
 
-        schema_mapping = {
-            "seller": SELLER_SCHEMA,
-            "listing": LISTING_SCHEMA,
-        }
-
-        results = self.batch_validator.validate_directory(directory, schema_mapping)
+        results = self.batch_validator.validate_directory(directory, _SCHEMA_BY_NAME)
 
         print(f"📊 Validated {len(results)} files")
 
@@ -182,10 +372,12 @@ class SchemaTestRunner:
         if schema is None:
             raise ValueError(f"Unknown schema type: {schema_type}")
 
-        from .validators import CSVSchemaValidator
-
-        validator = CSVSchemaValidator(schema)
-        validator.schema_name = schema_type
+        # Validators keep no per-file state, so one per schema type is reused
+        validator = self._validators.get(schema_type)
+        if validator is None:
+            validator = CSVSchemaValidator(schema)
+            validator.schema_name = schema_type
+            self._validators[schema_type] = validator
 
         return validator.validate_file(file_path)
 
@@ -225,14 +417,52 @@ class SchemaTestRunner:
         output_file = Path(output_file)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Prepare results for JSON serialization
-        serializable_results = self._make_serializable(results)
+        if "failed_files" in results:
+            results = {**results, "failed_files": sorted(results["failed_files"])}
 
         with open(output_file, "w") as f:
-            json.dump(serializable_results, f, indent=2, default=str)
+            self._write_json(results, f)
 
         print(f"💾 Baseline results saved to: {output_file}")
 
+    def _get_result_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load the per-file result cache from the workspace on first use."""
+        if self._result_cache is None:
+            self._result_cache = {}
+            try:
+                data = json.loads(self._cache_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return self._result_cache
+
+            # Results from other validation logic may not be comparable, and a
+            # file without a usable entries dict is treated the same way
+            if (
+                isinstance(data, dict)
+                and data.get("version") == _VALIDATION_LOGIC_VERSION
+                and isinstance(data.get("entries"), dict)
+            ):
+                self._result_cache = data["entries"]
+
+        return self._result_cache
+
+    def _save_result_cache(self) -> None:
+        """Persist the per-file result cache to the workspace."""
+        if self._result_cache is None:
+            return
+
+        try:
+            self._cache_path.write_text(
+                json.dumps(
+                    {
+                        "version": _VALIDATION_LOGIC_VERSION,
+                        "entries": self._result_cache,
+                    }
+                ),
+                encoding="utf-8",
+            )
+        except OSError as e:
+            print(f"⚠️  Could not save validation cache: {e}")
+
     def generate_detailed_report(
         self,
         results: Dict[str, Any],
@@ -250,19 +480,19 @@ class SchemaTestRunner:
         output_file = Path(output_file)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        if format_type == "html":
-            report_content = self._generate_html_report(results)
-        elif format_type == "markdown":
-            report_content = self._generate_markdown_report(results)
-        elif format_type == "json":
-            report_content = json.dumps(
-                self._make_serializable(results), indent=2, default=str
-            )
+        if format_type == "json":
+            with open(output_file, "w") as f:
+                self._write_json(results, f)
         else:
-            raise ValueError(f"Unsupported report format: {format_type}")
+            if format_type == "html":
+                report_content = self._generate_html_report(results)
+            elif format_type == "markdown":
+                report_content = self._generate_markdown_report(results)
+            else:
+                raise ValueError(f"Unsupported report format: {format_type}")
 
-        with open(output_file, "w") as f:
-            f.write(report_content)
+            with open(output_file, "w") as f:
+                f.write(report_content)
 
         print(f"📄 Detailed report saved to: {output_file}")
 
@@ -271,8 +501,12 @@ class SchemaTestRunner:
         results: Dict[str, ValidationResult],
         execution_time: float,
         include_warnings: bool = True,
+        timestamp: Optional[datetime] = None,
     ) -> Dict[str, Any]:
         """Generate comprehensive test summary."""
+        if timestamp is None:
+            timestamp = datetime.now()
+
         total_files = len(results)
 
         # Count results by status
@@ -283,6 +517,11 @@ class SchemaTestRunner:
         total_warnings = 0
         total_info = 0
 
+        # Analyze issues by type
+        issue_types: Counter[str] = Counter()
+        missing_columns_summary: Counter[str] = Counter()
+        extra_columns_summary: Counter[str] = Counter()
+
         for file_path, result in results.items():
             total_errors += result.error_count
             total_warnings += result.warning_count
@@ -293,21 +532,9 @@ class SchemaTestRunner:
             else:
                 failed_files.append(file_path)
 
-        # Analyze issues by type
-        issue_types: Dict[str, int] = {}
-        missing_columns_summary: Dict[str, int] = {}
-        extra_columns_summary: Dict[str, int] = {}
-
-        for result in results.values():
-            for issue in result.issues:
-                issue_type = issue.issue_type
-                issue_types[issue_type] = issue_types.get(issue_type, 0) + 1
-
-            for col in result.missing_columns:
-                missing_columns_summary[col] = missing_columns_summary.get(col, 0) + 1
-
-            for col in result.extra_columns:
-                extra_columns_summary[col] = extra_columns_summary.get(col, 0) + 1
+            issue_types.update([issue.issue_type for issue in result.issues])
+            missing_columns_summary.update(result.missing_columns)
+            extra_columns_summary.update(result.extra_columns)
 
         return {
             "summary": {
@@ -325,54 +552,73 @@ class SchemaTestRunner:
                 "total_info": total_info,
             },
             "issue_analysis": {
-                "issue_types": issue_types,
-                "missing_columns": missing_columns_summary,
-                "extra_columns": extra_columns_summary,
+                "issue_types": dict(issue_types),
+                "missing_columns": dict(missing_columns_summary),
+                "extra_columns": dict(extra_columns_summary),
             },
             "detailed_results": results,
             "passed_files": passed_files,
             "failed_files": failed_files,
-            "timestamp": datetime.now().isoformat(),
+            # (file name, errors, warnings) of the worst failures, for display
+            "top_failed": [
+                (
+                    os.path.basename(file_path),
+                    results[file_path].error_count,
+                    results[file_path].warning_count,
+                )
+                for file_path in heapq.nlargest(
+                    5, failed_files, key=lambda path: results[path].error_count
+                )
+            ],
+            "timestamp": timestamp.isoformat(),
         }
 
     def _print_final_summary(self, test_summary: Dict[str, Any]) -> None:
-        """Print final test summary to console."""
+        """
+        Print final test summary to console.
+
+        The summary is assembled in memory and written with a single call,
+        rather than one ``print`` per line.
+        """
         summary = test_summary["summary"]
         issues = test_summary["issue_counts"]
 
-        print("\n" + "=" * 60)
-        print("📊 FINAL TEST RESULTS")
-        print("=" * 60)
-
-        print(f"Total files validated: {summary['total_files']}")
-        print(f"✅ Passed: {summary['passed_files']}")
-        print(f"❌ Failed: {summary['failed_files']}")
-        print(f"📈 Success rate: {summary['success_rate']:.1f}%")
-        print(f"⏱️  Execution time: {summary['execution_time_seconds']:.2f}s")
-
-        print(f"\n🚨 Issue Summary:")
-        print(f"   Errors: {issues['total_errors']}")
-        print(f"   Warnings: {issues['total_warnings']}")
-        print(f"   Info: {issues['total_info']}")
+        lines = [
+            "\n" + "=" * 60,
+            "📊 FINAL TEST RESULTS",
+            "=" * 60,
+            f"Total files validated: {summary['total_files']}",
+            f"✅ Passed: {summary['passed_files']}",
+            f"❌ Failed: {summary['failed_files']}",
+            f"📈 Success rate: {summary['success_rate']:.1f}%",
+            f"⏱️  Execution time: {summary['execution_time_seconds']:.2f}s",
+            "\n🚨 Issue Summary:",
+            f"   Errors: {issues['total_errors']}",
+            f"   Warnings: {issues['total_warnings']}",
+            f"   Info: {issues['total_info']}",
+        ]
 
         if test_summary["failed_files"]:
-            print(f"\n❌ Failed files:")
-            for file_path in test_summary["failed_files"][:5]:  # Show first 5
-                result = test_summary["detailed_results"][file_path]
-                print(
-                    f"   • {Path(file_path).name} ({result.error_count} errors, {result.warning_count} warnings)"
+            lines.append("\n❌ Failed files:")
+            for name, error_count, warning_count in test_summary["top_failed"]:
+                lines.append(
+                    f"   • {name} ({error_count} errors, {warning_count} warnings)"
                 )
 
             if len(test_summary["failed_files"]) > 5:
-                print(f"   ... and {len(test_summary['failed_files']) - 5} more")
+                lines.append(f"   ... and {len(test_summary['failed_files']) - 5} more")
 
         # Final status
         if summary["failed_files"] == 0:
-            print(f"\n🎉 ALL TESTS PASSED!")
+            lines.append("\n🎉 ALL TESTS PASSED!")
         else:
-            print(f"\n⚠️  {summary['failed_files']} FILES FAILED VALIDATION")
+            lines.append(f"\n⚠️  {summary['failed_files']} FILES FAILED VALIDATION")
 
-        print("=" * 60)
+        lines.append("=" * 60)
+        lines.append("")
+
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
 
     def _load_baseline_results(self, baseline_file: Union[str, Path]) -> Dict[str, Any]:
         """Load baseline results from file."""
@@ -420,8 +666,9 @@ class SchemaTestRunner:
         baseline_failed = set(baseline.get("failed_files", []))
         current_failed = set(current.get("failed_files", []))
 
-        regression_analysis["new_failures"] = list(current_failed - baseline_failed)
-        regression_analysis["resolved_failures"] = list(
+        # Sorted so regression reports are stable from run to run
+        regression_analysis["new_failures"] = sorted(current_failed - baseline_failed)
+        regression_analysis["resolved_failures"] = sorted(
             baseline_failed - current_failed
         )
 
@@ -435,8 +682,56 @@ class SchemaTestRunner:
 
         return regression_analysis
 
+    def _write_json(self, results: Dict[str, Any], out: TextIO) -> None:
+        """
+        Write results as indented JSON, one validation result at a time.
+
+        The output matches ``json.dumps(..., indent=2)`` of the whole
+        serialized tree, but only a single entry of ``detailed_results`` is
+        converted and encoded at once, so peak memory does not grow with the
+        number of files. Each piece is encoded with ``json.dumps``, which
+        uses the C encoder; ``json.dump`` falls back to the pure-Python one
+        whenever indent is set.
+        """
+        if not results:
+            out.write("{}")
+            return
+
+        separator = "{"
+        for key, value in results.items():
+            out.write(f"{separator}\n  {json.dumps(key)}: ")
+            separator = ","
+
+            if key == "detailed_results" and isinstance(value, dict) and value:
+                entry_separator = "{"
+                for file_path, result in value.items():
+                    encoded = json.dumps(
+                        self._make_serializable(result), indent=2, default=str
+                    )
+                    out.write(f"{entry_separator}\n    {json.dumps(file_path)}: ")
+                    out.write(encoded.replace("\n", "\n    "))
+                    entry_separator = ","
+                out.write("\n  }")
+            else:
+                encoded = json.dumps(
+                    self._make_serializable(value), indent=2, default=str
+                )
+                out.write(encoded.replace("\n", "\n  "))
+
+        out.write("\n}")
+
     def _make_serializable(self, obj: Any) -> Any:
         """Make object JSON serializable."""
+        # Most nodes are plain scalars or containers; route them on their
+        # exact type before falling back to the isinstance chain
+        obj_type = type(obj)
+        if obj_type in _JSON_SCALAR_TYPES:
+            return obj
+        if obj_type is dict:
+            return {k: self._make_serializable(v) for k, v in obj.items()}
+        if obj_type is list:
+            return [self._make_serializable(item) for item in obj]
+
         if isinstance(obj, ValidationResult):
             return {
                 "file_path": obj.file_path,
@@ -451,8 +746,11 @@ class SchemaTestRunner:
                 "extra_columns": obj.extra_columns,
                 "validation_timestamp": obj.validation_timestamp.isoformat(),
                 "execution_time_ms": obj.execution_time_ms,
-                "issues": [self._make_serializable(issue) for issue in obj.issues],
+                "issues": [issue.to_dict() for issue in obj.issues],
+                "issues_truncated": obj.issues_truncated,
             }
+        elif isinstance(obj, ValidationIssue):
+            return obj.to_dict()
         elif hasattr(obj, "__dict__"):
             return {k: self._make_serializable(v) for k, v in obj.__dict__.items()}  # type: ignore
         elif isinstance(obj, dict):
@@ -469,24 +767,7 @@ class SchemaTestRunner:
         summary = results["summary"]
         issues = results["issue_counts"]
 
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Schema Validation Report</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 40px; }}
-                .header {{ background: #f4f4f4; padding: 20px; border-radius: 5px; }}
-                .summary {{ margin: 20px 0; }}
-                .passed {{ color: #28a745; }}
-                .failed {{ color: #dc3545; }}
-                .warning {{ color: #ffc107; }}
-                table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
-                th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                th {{ background-color: #f2f2f2; }}
-            </style>
-        </head>
-        <body>
+        html = f"""\
             <div class="header">
                 <h1>📊 Schema Validation Report</h1>
                 <p>Generated on: {results.get("timestamp", "Unknown")}</p>
@@ -509,11 +790,30 @@ class SchemaTestRunner:
                     <li>Info: {issues["total_info"]}</li>
                 </ul>
             </div>
+        """
+
+        parts = [_HTML_REPORT_HEAD, html]
+
+        if results.get("failed_files"):
+            parts.append("""
+            <h2>Failed Files</h2>
+            <table>
+                <tr><th>File</th><th>Errors</th><th>Warnings</th></tr>
+""")
+            for file_path in results["failed_files"]:
+                result = results["detailed_results"][file_path]
+                parts.append(
+                    f"                <tr><td>{escape(os.path.basename(file_path))}</td>"
+                    f"<td>{result.error_count}</td><td>{result.warning_count}</td></tr>\n"
+                )
+            parts.append("            </table>\n")
+
+        parts.append("""
         </body>
         </html>
-        """
+        """)
 
-        return html
+        return "".join(parts)
 
     def _generate_markdown_report(self, results: Dict[str, Any]) -> str:
         """Generate Markdown report."""
@@ -540,10 +840,14 @@ Generated on: {results.get("timestamp", "Unknown")}
 
 """
 
+        parts = [markdown]
+
         if results.get("failed_files"):
-            markdown += "\n## Failed Files\n\n"
+            parts.append("\n## Failed Files\n\n")
             for file_path in results["failed_files"]:
                 result = results["detailed_results"][file_path]
-                markdown += f"- `{Path(file_path).name}` ({result.error_count} errors, {result.warning_count} warnings)\n"
+                parts.append(
+                    f"- `{os.path.basename(file_path)}` ({result.error_count} errors, {result.warning_count} warnings)\n"
+                )
 
-        return markdown
+        return "".join(parts)
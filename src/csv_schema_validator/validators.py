@@ -6,20 +6,155 @@ Comprehensive validation framework for CSV files using only standard library.
 This version doesn't require pandas and works with just the csv module.
 """
 
+import codecs
 import csv
 import json
+import multiprocessing
+import os
 import re
 import uuid
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from dataclasses import field as dataclass_field
 from datetime import datetime
+from functools import partial
+from itertools import chain, islice, zip_longest
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlparse
 
 from .schemas import DataType, SchemaField
 
-
-@dataclass
+# Files at least this large are read through a bigger buffer so the OS can
+# stream them in long sequential reads instead of many small ones
+_LARGE_FILE_BYTES = 8 * 1024 * 1024
+_LARGE_FILE_BUFFER = 1024 * 1024
+
+# Booleans are matched case-insensitively; the usual spellings are looked up
+# directly so most values don't need lowercasing
+_BOOLEAN_WORDS = frozenset({"true", "false"})
+_BOOLEAN_SPELLINGS = frozenset({"true", "false", "True", "False", "TRUE", "FALSE"})
+
+# Delimiter sniffing reads whole lines until it has at least this many
+# characters; Sniffer's cost grows steeply with sample size, so the sniffed
+# text is also capped in case the first line is very long
+_SNIFF_SAMPLE_CHARS = 4096
+_SNIFF_MAX_CHARS = 64 * 1024
+_SNIFF_DELIMITERS = ",;\t|"
+_SNIFF_CACHE_SIZE = 64
+
+# Most columns repeat a small set of values, so each column remembers up to
+# this many check results; high-cardinality columns stop adding once it is full
+_CHECK_CACHE_SIZE = 4096
+
+# Encoding is decided from this much of the start of each file: UTF-8 when it
+# decodes cleanly (dropping any byte-order mark), otherwise Latin-1, which
+# accepts every byte sequence
+_ENCODING_SAMPLE_BYTES = 64 * 1024
+
+# Bump whenever a change can alter the result for the same file and schema, so
+# results persisted by earlier validation logic are not reused
+_VALIDATION_LOGIC_VERSION = 2
+
+# Issue types that may come from a transient read failure (e.g. a file caught
+# mid-write); results carrying them are never reused from a cache
+_UNCACHEABLE_ISSUE_TYPES = frozenset({"file_not_found", "parse_error"})
+
+# Batches smaller than this are validated in-process; below it, worker start-up
+# costs more than the parallelism saves
+_PARALLEL_MIN_FILES = 4
+
+# The usual hyphenated UUID form; uuid.UUID also accepts braces, "urn:uuid:"
+# prefixes and undashed hex, so other values fall back to it
+_CANONICAL_UUID_PATTERN = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+
+_EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+# URLs whose scheme and plain ASCII host are certain to satisfy urlparse;
+# anything else still goes through urlparse for the final say
+_SIMPLE_URL_PATTERN = re.compile(
+    r"[A-Za-z][A-Za-z0-9+.\-]*://[A-Za-z0-9\-._~%!$&'()*+,;=:@]+(?:[/?#]|\Z)"
+)
+
+# Whitespace json.loads skips before a document
+_JSON_WHITESPACE = " \t\n\r"
+
+# Formats accepted for datetime fields that have no format pattern, keyed by
+# (has "T" separator, has fractional seconds). Other than the year, month and
+# so on, only those literals differ, so a value can fit at most one format.
+_COMMON_DATETIME_FORMATS: Dict[Tuple[bool, bool], str] = {
+    (False, True): "%Y-%m-%d %H:%M:%S.%f",
+    (False, False): "%Y-%m-%d %H:%M:%S",
+    (True, True): "%Y-%m-%dT%H:%M:%S.%fZ",
+    (True, False): "%Y-%m-%dT%H:%M:%SZ",
+}
+
+# Data type -> (issue type, label, suggestion) reported when a value fails
+# its type check
+_TYPE_ISSUES: Dict[DataType, Tuple[str, str, str]] = {
+    DataType.UUID: (
+        "invalid_uuid",
+        "UUID",
+        "Provide a valid UUID (e.g., '123e4567-e89b-12d3-a456-426614174000')",
+    ),
+    DataType.EMAIL: (
+        "invalid_email",
+        "email",
+        "Provide a valid email address (e.g., 'user@example.com')",
+    ),
+    DataType.URL: (
+        "invalid_url",
+        "URL",
+        "Provide a valid URL (e.g., 'https://example.com')",
+    ),
+    DataType.DATETIME: (
+        "invalid_datetime",
+        "datetime",
+        "Use format: YYYY-MM-DD HH:MM:SS.mmm",
+    ),
+    DataType.JSON_ARRAY: (
+        "invalid_json_array",
+        "JSON array",
+        "Provide valid JSON array (e.g., '[\"item1\", \"item2\"]' or '[]')",
+    ),
+    DataType.JSON_OBJECT: (
+        "invalid_json_object",
+        "JSON object",
+        "Provide valid JSON object (e.g., '{\"key\": \"value\"}' or '{}')",
+    ),
+    DataType.INTEGER: (
+        "invalid_integer",
+        "integer",
+        "Provide a valid integer (e.g., '123', '0', '-456')",
+    ),
+    DataType.FLOAT: (
+        "invalid_float",
+        "float",
+        "Provide a valid float (e.g., '12.34', '0.0', '-456.78')",
+    ),
+    DataType.BOOLEAN: (
+        "invalid_boolean",
+        "boolean",
+        "Use 'true' or 'false' (lowercase)",
+    ),
+}
+
+
+@dataclass(slots=True)
 class ValidationIssue:
     """Represents a single validation issue."""
 
@@ -32,8 +167,21 @@ class ValidationIssue:
     row_number: Optional[int] = None
     suggestion: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the issue as a plain dict.
+
+        Unlike ``dataclasses.asdict`` this does no recursive deep copy; all
+        field values are fetched by a single C-level ``attrgetter`` call.
+        """
+        return dict(zip(_ISSUE_FIELD_NAMES, _get_issue_values(self)))
+
+
+_ISSUE_FIELD_NAMES = tuple(f.name for f in fields(ValidationIssue))
+_get_issue_values = attrgetter(*_ISSUE_FIELD_NAMES)
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationResult:
     """Results of CSV schema validation."""
 
@@ -47,39 +195,145 @@ class ValidationResult:
     extra_columns: List[str]
     validation_timestamp: datetime
     execution_time_ms: float
+    # Per-severity counts of issues dropped once the validator's cap was hit
+    dropped_issue_counts: Dict[str, int] = dataclass_field(default_factory=dict)
+    # (issues list, its length, partition) from the last issues_by_severity call
+    _severity_memo: Optional[
+        Tuple[List[ValidationIssue], int, Dict[str, List[ValidationIssue]]]
+    ] = dataclass_field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def issues_by_severity(self) -> Dict[str, List[ValidationIssue]]:
+        """
+        Issues partitioned by severity in a single pass.
+
+        The partition is reused until ``issues`` is reassigned or changes
+        length, so issues appended or removed later are still counted.
+        Replacing an item in place is not detected.
+        """
+        issues = self.issues
+        memo = self._severity_memo
+        if memo is not None and memo[0] is issues and memo[1] == len(issues):
+            return memo[2]
+
+        grouped: Dict[str, List[ValidationIssue]] = {
+            "error": [],
+            "warning": [],
+            "info": [],
+        }
+        for issue in issues:
+            grouped.setdefault(issue.severity, []).append(issue)
+        self._severity_memo = (issues, len(issues), grouped)
+        return grouped
+
+    @property
+    def errors(self) -> List[ValidationIssue]:
+        """Error-level issues."""
+        return self.issues_by_severity["error"]
+
+    @property
+    def warnings(self) -> List[ValidationIssue]:
+        """Warning-level issues."""
+        return self.issues_by_severity["warning"]
+
+    @property
+    def infos(self) -> List[ValidationIssue]:
+        """Info-level issues."""
+        return self.issues_by_severity["info"]
+
+    @property
+    def issues_truncated(self) -> int:
+        """Number of issues found but not retained in ``issues``."""
+        return sum(self.dropped_issue_counts.values())
+
+    @property
+    def total_issue_count(self) -> int:
+        """Number of issues found, including any that were not retained."""
+        return len(self.issues) + self.issues_truncated
 
     @property
     def error_count(self) -> int:
         """Number of error-level issues."""
-        return len([issue for issue in self.issues if issue.severity == "error"])
+        return len(self.errors) + self.dropped_issue_counts.get("error", 0)
 
     @property
     def warning_count(self) -> int:
         """Number of warning-level issues."""
-        return len([issue for issue in self.issues if issue.severity == "warning"])
+        return len(self.warnings) + self.dropped_issue_counts.get("warning", 0)
 
     @property
     def info_count(self) -> int:
         """Number of info-level issues."""
-        return len([issue for issue in self.issues if issue.severity == "info"])
+        return len(self.infos) + self.dropped_issue_counts.get("info", 0)
 
 
 class CSVSchemaValidator:
     """Main validator class for CSV schema validation using standard library."""
 
-    def __init__(self, schema: List[SchemaField]):
-        """Initialize validator with schema definition."""
+    def __init__(
+        self,
+        schema: List[SchemaField],
+        chunk_rows: int = 100_000,
+        max_issues: Optional[int] = 1000,
+    ):
+        """
+        Initialize validator with schema definition.
+
+        Args:
+            schema: Field definitions to validate against
+            chunk_rows: Number of rows held in memory at once while validating
+            max_issues: Maximum number of issues kept per file (None for no
+                limit); further issues are only counted
+        """
         self.schema = schema
+        self.chunk_rows = chunk_rows
+        self.max_issues = max_issues
         self.schema_fields = {field.name: field for field in schema}
         self.required_columns = {field.name for field in schema if field.required}
         self.schema_name = "unknown"  # Will be set by test runner
 
+        # Resolve each field's type check once rather than branching per value
+        self._type_checks: Dict[str, Callable[[str], bool]] = {}
+        for field in schema:
+            check = self._get_type_check(field)
+            if check is not None:
+                self._type_checks[field.name] = check
+
+        # Results of each column's type check, keyed by the stripped value
+        self._check_results: Dict[str, Dict[str, bool]] = {
+            name: {} for name in self._type_checks
+        }
+
+        # A type issue's description depends only on its column, so it is
+        # formatted once here rather than for every invalid value
+        self._type_issue_descriptions: Dict[str, str] = {
+            name: f"Invalid {_TYPE_ISSUES[self.schema_fields[name].data_type][1]} "
+            f"format in field '{name}'"
+            for name in self._type_checks
+        }
+
+        # Delimiters sniffed so far, keyed by the file's header line
+        self._delimiters_by_header: Dict[str, str] = {}
+
+        # Only these fields can produce value-level issues; other columns
+        # (e.g. nullable strings) are skipped without looking at their values
+        self._checked_fields: Dict[str, SchemaField] = {
+            field.name: field
+            for field in schema
+            if field.name in self._type_checks
+            or (field.required and not field.nullable)
+        }
+
     def validate_file(self, file_path: Union[str, Path]) -> ValidationResult:
         """Validate a CSV file against the schema."""
         start_time = datetime.now()
         file_path = Path(file_path)
 
-        if not file_path.exists():
+        # One stat both confirms the file exists and sizes the read buffer
+        try:
+            file_size = file_path.stat().st_size
+        except (FileNotFoundError, NotADirectoryError, ValueError):
+            # ValueError: the path can't name a file (e.g. an embedded NUL)
             return ValidationResult(
                 file_path=str(file_path),
                 schema_name=self.schema_name,
@@ -99,54 +353,78 @@ class CSVSchemaValidator:
                 validation_timestamp=start_time,
                 execution_time_ms=0.0,
             )
+        except OSError:
+            file_size = 0  # Unreadable; opening it below reports the error
 
         try:
-            # Load CSV file using standard csv module
-            csv_data = []
-            csv_columns = []
-
-            with open(file_path, "r", encoding="utf-8", newline="") as csvfile:
-                # Auto-detect delimiter
-                sample = csvfile.read(1024)
-                csvfile.seek(0)
-                sniffer = csv.Sniffer()
-                delimiter = sniffer.sniff(sample).delimiter
-
-                reader = csv.DictReader(csvfile, delimiter=delimiter)
-                csv_columns = reader.fieldnames or []
-                csv_data = list(reader)
-
             issues: List[ValidationIssue] = []
-
-            # Check column structure
-            missing_columns = self._check_missing_columns(list(csv_columns))
-            extra_columns = self._check_extra_columns(list(csv_columns))
-
-            # Add column structure issues
-            for col in missing_columns:
-                issues.append(
-                    ValidationIssue(
-                        field_name=col,
-                        issue_type="missing_column",
-                        severity="error",
-                        description=f"Required column '{col}' is missing from CSV",
-                        suggestion=f"Add column '{col}' to the CSV file",
+            dropped: Dict[str, int] = {}
+            csv_columns: List[str] = []
+            total_rows = 0
+
+            buffering = -1
+            if file_size >= _LARGE_FILE_BYTES:
+                buffering = _LARGE_FILE_BUFFER
+
+            encoding = _detect_encoding(file_path)
+            with open(
+                file_path, "r", encoding=encoding, newline="", buffering=buffering
+            ) as csvfile:
+                # Auto-detect delimiter from whole lines at the start of the
+                # file, then hand those same lines to the reader
+                sample_lines = _read_sample_lines(csvfile)
+                delimiter = self._sniff_delimiter(sample_lines)
+
+                # Positional rows avoid building a dict per record
+                reader = csv.reader(chain(sample_lines, csvfile), delimiter=delimiter)
+                csv_columns = next(reader, [])
+
+                # Check column structure
+                missing_columns = self._check_missing_columns(csv_columns)
+                extra_columns = self._check_extra_columns(csv_columns)
+
+                # Add column structure issues
+                for col in missing_columns:
+                    issues.append(
+                        ValidationIssue(
+                            field_name=col,
+                            issue_type="missing_column",
+                            severity="error",
+                            description=f"Required column '{col}' is missing from CSV",
+                            suggestion=f"Add column '{col}' to the CSV file",
+                        )
                     )
-                )
 
-            for col in extra_columns:
-                issues.append(
-                    ValidationIssue(
-                        field_name=col,
-                        issue_type="extra_column",
-                        severity="warning",
-                        description=f"Unexpected column '{col}' found in CSV",
-                        suggestion=f"Remove column '{col}' or update schema",
+                for col in extra_columns:
+                    issues.append(
+                        ValidationIssue(
+                            field_name=col,
+                            issue_type="extra_column",
+                            severity="warning",
+                            description=f"Unexpected column '{col}' found in CSV",
+                            suggestion=f"Remove column '{col}' or update schema",
+                        )
                     )
-                )
 
-            # Validate data content
-            issues.extend(self._validate_data_content(csv_data))
+                self._truncate_issues(issues, dropped)
+
+                # Validate data content one bounded chunk of rows at a time.
+                # Only the issues still within max_issues are built; the rest
+                # are just counted in ``dropped``.
+                rows = (row for row in reader if row)
+                while True:
+                    chunk = list(islice(rows, self.chunk_rows))
+                    if not chunk:
+                        break
+                    budget = None
+                    if self.max_issues is not None:
+                        budget = self.max_issues - len(issues)
+                    issues.extend(
+                        self._validate_data_content(
+                            csv_columns, chunk, total_rows, budget, dropped
+                        )
+                    )
+                    total_rows += len(chunk)
 
             end_time = datetime.now()
             execution_time = (end_time - start_time).total_seconds() * 1000
@@ -154,14 +432,16 @@ class CSVSchemaValidator:
             return ValidationResult(
                 file_path=str(file_path),
                 schema_name=self.schema_name,
-                is_valid=len([i for i in issues if i.severity == "error"]) == 0,
-                total_rows=len(csv_data),
+                is_valid=not dropped.get("error")
+                and not any(issue.severity == "error" for issue in issues),
+                total_rows=total_rows,
                 total_columns=len(csv_columns),
                 issues=issues,
                 missing_columns=missing_columns,
                 extra_columns=extra_columns,
                 validation_timestamp=start_time,
                 execution_time_ms=execution_time,
+                dropped_issue_counts=dropped,
             )
 
         except Exception as e:
@@ -188,6 +468,32 @@ class CSVSchemaValidator:
                 execution_time_ms=execution_time,
             )
 
+    def _sniff_delimiter(self, sample_lines: List[str]) -> str:
+        """
+        Detect the delimiter of a file from its first lines.
+
+        Files sharing a header line share a delimiter, so the result is
+        remembered per header and sniffing runs once per distinct header.
+        """
+        header = sample_lines[0] if sample_lines else ""
+        delimiter = self._delimiters_by_header.get(header)
+        if delimiter is None:
+            delimiter = _sniff_delimiter("".join(sample_lines))
+            if len(self._delimiters_by_header) < _SNIFF_CACHE_SIZE:
+                self._delimiters_by_header[header] = delimiter
+        return delimiter
+
+    def _truncate_issues(
+        self, issues: List[ValidationIssue], dropped: Dict[str, int]
+    ) -> None:
+        """Drop issues beyond ``max_issues``, counting them by severity."""
+        if self.max_issues is None or len(issues) <= self.max_issues:
+            return
+
+        for issue in issues[self.max_issues :]:
+            dropped[issue.severity] = dropped.get(issue.severity, 0) + 1
+        del issues[self.max_issues :]
+
     def _check_missing_columns(self, csv_columns: List[str]) -> List[str]:
         """Check for missing required columns."""
         csv_column_set = set(csv_columns)
@@ -195,210 +501,174 @@ class CSVSchemaValidator:
 
     def _check_extra_columns(self, csv_columns: List[str]) -> List[str]:
         """Check for unexpected columns not in schema."""
-        schema_column_set = set(self.schema_fields.keys())
-        return [col for col in csv_columns if col not in schema_column_set]
+        return [col for col in csv_columns if col not in self.schema_fields]
 
     def _validate_data_content(
-        self, csv_data: List[Dict[str, Any]]
+        self,
+        csv_columns: List[str],
+        csv_rows: List[List[str]],
+        row_offset: int = 0,
+        budget: Optional[int] = None,
+        dropped: Optional[Dict[str, int]] = None,
     ) -> List[ValidationIssue]:
-        """Validate the actual data content against schema rules."""
+        """
+        Validate the actual data content against schema rules.
+
+        Rows are transposed into columns in a single C-level pass, so each
+        schema field is checked against one contiguous sequence of values.
+        Short rows are padded with empty values. ``row_offset`` is the number
+        of data rows that precede ``csv_rows`` in the file. Columns whose field
+        has nothing to check per value are skipped entirely. When a header
+        repeats a name, only its last column is checked, as with
+        ``csv.DictReader``.
+
+        At most ``budget`` issues are returned (None for no limit); issues
+        past it are only counted by severity in ``dropped``.
+        """
         issues: List[ValidationIssue] = []
 
-        # Get all column names that exist in both schema and data
-        data_columns: set[str] = set(csv_data[0].keys()) if csv_data else set()
-        common_columns: set[str] = data_columns.intersection(
-            set(self.schema_fields.keys())
-        )
+        if not csv_rows:
+            return issues
 
-        for column_name in common_columns:
-            field = self.schema_fields[column_name]
-            column_data = [row.get(column_name, "") for row in csv_data]
-            issues.extend(self._validate_column_data(column_name, column_data, field))
+        last_index = {name: index for index, name in enumerate(csv_columns)}
+        columns = zip_longest(*csv_rows, fillvalue="")
+        for index, (column_name, column_data) in enumerate(zip(csv_columns, columns)):
+            field = self._checked_fields.get(column_name)
+            if field is None or last_index[column_name] != index:
+                continue
+            column_budget = None if budget is None else budget - len(issues)
+            issues.extend(
+                self._validate_column_data(
+                    column_name,
+                    column_data,
+                    field,
+                    row_offset,
+                    column_budget,
+                    dropped,
+                )
+            )
 
         return issues
 
     def _validate_column_data(
-        self, column_name: str, column_data: List[str], field: SchemaField
+        self,
+        column_name: str,
+        column_data: Sequence[str],
+        field: SchemaField,
+        row_offset: int = 0,
+        budget: Optional[int] = None,
+        dropped: Optional[Dict[str, int]] = None,
     ) -> List[ValidationIssue]:
-        """Validate a single column's data against its field definition."""
-        issues: List[ValidationIssue] = []
-
-        for row_idx, value in enumerate(column_data):
-            # Check for required but missing values
-            if field.required and not field.nullable:
-                if (
-                    not value
-                    or str(value).strip() == ""
-                    or str(value).strip().lower() == "null"
-                ):
-                    issues.append(
-                        ValidationIssue(
-                            field_name=column_name,
-                            issue_type="required_field_missing",
-                            severity="error",
-                            description=f"Required field '{column_name}' is missing or null",
-                            row_number=row_idx
-                            + 2,  # +2 because csv index starts at 0 and has header
-                            actual_value=str(value),
-                            suggestion=f"Provide a valid {field.data_type.value} value",
-                        )
-                    )
-                    continue
-
-            # Validate data types for non-null values
-            str_value = str(value).strip()
-            if str_value == "" or str_value.lower() == "null":
-                continue  # Skip null/empty values
-
-            validation_issues = self._validate_single_value(
-                column_name, str_value, field, row_idx + 2
-            )
-            issues.extend(validation_issues)
-
-        return issues
+        """
+        Validate a single column's data against its field definition.
 
-    def _validate_single_value(
-        self, column_name: str, value: str, field: SchemaField, row_number: int
-    ) -> List[ValidationIssue]:
-        """Validate a single value against field definition."""
+        At most ``budget`` issues are built (None for no limit); once it is
+        spent, further issues are only counted by severity in ``dropped``.
+        """
         issues: List[ValidationIssue] = []
+        if dropped is None:
+            dropped = {}
+        must_be_present = field.required and not field.nullable
+        check = self._type_checks.get(column_name)
+        missing_description = f"Required field '{column_name}' is missing or null"
+        missing_suggestion = f"Provide a valid {field.data_type.value} value"
+
+        for row_idx, value in enumerate(column_data, row_offset):
+            # csv yields str values; strip each one only once. Only a
+            # four-character value can be a "null" token, so most values are
+            # never lowercased.
+            str_value = value.strip()
+            is_null = not str_value or (
+                len(str_value) == 4 and str_value.lower() == "null"
+            )
 
-        if value == "" or value.lower() == "null":
-            return issues  # Handle null/empty values separately
-
-        # Type-specific validation
-        if field.data_type == DataType.UUID:
-            if not self._is_valid_uuid(value):
-                issues.append(
-                    ValidationIssue(
-                        field_name=column_name,
-                        issue_type="invalid_uuid",
-                        severity="error",
-                        description=f"Invalid UUID format in field '{column_name}'",
-                        actual_value=value,
-                        row_number=row_number,
-                        suggestion="Provide a valid UUID (e.g., '123e4567-e89b-12d3-a456-426614174000')",
-                    )
-                )
-
-        elif field.data_type == DataType.EMAIL:
-            if value.lower() != "null" and not self._is_valid_email(value):
-                issues.append(
-                    ValidationIssue(
-                        field_name=column_name,
-                        issue_type="invalid_email",
-                        severity="error",
-                        description=f"Invalid email format in field '{column_name}'",
-                        actual_value=value,
-                        row_number=row_number,
-                        suggestion="Provide a valid email address (e.g., 'user@example.com')",
-                    )
-                )
-
-        elif field.data_type == DataType.URL:
-            if value.lower() != "null" and not self._is_valid_url(value):
-                issues.append(
-                    ValidationIssue(
-                        field_name=column_name,
-                        issue_type="invalid_url",
-                        severity="error",
-                        description=f"Invalid URL format in field '{column_name}'",
-                        actual_value=value,
-                        row_number=row_number,
-                        suggestion="Provide a valid URL (e.g., 'https://example.com')",
-                    )
-                )
+            if is_null:
+                if not must_be_present:
+                    continue  # Skip null/empty values
+            elif check is None or self._is_valid_value(column_name, str_value):
+                continue
 
-        elif field.data_type == DataType.DATETIME:
-            if not self._is_valid_datetime(value, field.format_pattern):
-                issues.append(
-                    ValidationIssue(
-                        field_name=column_name,
-                        issue_type="invalid_datetime",
-                        severity="error",
-                        description=f"Invalid datetime format in field '{column_name}'",
-                        actual_value=value,
-                        row_number=row_number,
-                        expected_value=field.format_pattern,
-                        suggestion="Use format: YYYY-MM-DD HH:MM:SS.mmm",
-                    )
-                )
+            # Every value-level issue is an error
+            if budget is not None and len(issues) >= budget:
+                dropped["error"] = dropped.get("error", 0) + 1
+                continue
 
-        elif field.data_type == DataType.JSON_ARRAY:
-            if not self._is_valid_json_array(value):
+            if is_null:
+                # Required but missing value
                 issues.append(
                     ValidationIssue(
                         field_name=column_name,
-                        issue_type="invalid_json_array",
+                        issue_type="required_field_missing",
                         severity="error",
-                        description=f"Invalid JSON array format in field '{column_name}'",
+                        description=missing_description,
+                        row_number=row_idx
+                        + 2,  # +2 because csv index starts at 0 and has header
                         actual_value=value,
-                        row_number=row_number,
-                        suggestion="Provide valid JSON array (e.g., '[\"item1\", \"item2\"]' or '[]')",
+                        suggestion=missing_suggestion,
                     )
                 )
-
-        elif field.data_type == DataType.JSON_OBJECT:
-            if not self._is_valid_json_object(value):
+            else:
                 issues.append(
-                    ValidationIssue(
-                        field_name=column_name,
-                        issue_type="invalid_json_object",
-                        severity="error",
-                        description=f"Invalid JSON object format in field '{column_name}'",
-                        actual_value=value,
-                        row_number=row_number,
-                        suggestion="Provide valid JSON object (e.g., '{\"key\": \"value\"}' or '{}')",
-                    )
+                    self._type_issue(column_name, str_value, field, row_idx + 2)
                 )
 
-        elif field.data_type == DataType.INTEGER:
-            if not self._is_valid_integer(value):
-                issues.append(
-                    ValidationIssue(
-                        field_name=column_name,
-                        issue_type="invalid_integer",
-                        severity="error",
-                        description=f"Invalid integer format in field '{column_name}'",
-                        actual_value=value,
-                        row_number=row_number,
-                        suggestion="Provide a valid integer (e.g., '123', '0', '-456')",
-                    )
-                )
+        return issues
 
-        elif field.data_type == DataType.FLOAT:
-            if not self._is_valid_float(value):
-                issues.append(
-                    ValidationIssue(
-                        field_name=column_name,
-                        issue_type="invalid_float",
-                        severity="error",
-                        description=f"Invalid float format in field '{column_name}'",
-                        actual_value=value,
-                        row_number=row_number,
-                        suggestion="Provide a valid float (e.g., '12.34', '0.0', '-456.78')",
-                    )
-                )
+    def _is_valid_value(self, column_name: str, value: str) -> bool:
+        """
+        Run a column's type check on a value, remembering the result.
 
-        elif field.data_type == DataType.BOOLEAN:
-            if not self._is_valid_boolean(value):
-                issues.append(
-                    ValidationIssue(
-                        field_name=column_name,
-                        issue_type="invalid_boolean",
-                        severity="error",
-                        description=f"Invalid boolean format in field '{column_name}'",
-                        actual_value=value,
-                        row_number=row_number,
-                        suggestion="Use 'true' or 'false' (lowercase)",
-                    )
-                )
+        ``value`` must already be stripped and non-null, and the column must
+        have a type check.
+        """
+        seen = self._check_results[column_name]
+        is_valid = seen.get(value)
+        if is_valid is None:
+            is_valid = self._type_checks[column_name](value)
+            if len(seen) < _CHECK_CACHE_SIZE:
+                seen[value] = is_valid
+        return is_valid
+
+    def _type_issue(
+        self, column_name: str, value: str, field: SchemaField, row_number: int
+    ) -> ValidationIssue:
+        """Build the issue reported for a value that fails its type check."""
+        issue_type, _, suggestion = _TYPE_ISSUES[field.data_type]
+        return ValidationIssue(
+            field_name=column_name,
+            issue_type=issue_type,
+            severity="error",
+            description=self._type_issue_descriptions[column_name],
+            actual_value=value,
+            row_number=row_number,
+            expected_value=(
+                field.format_pattern if field.data_type == DataType.DATETIME else None
+            ),
+            suggestion=suggestion,
+        )
 
-        return issues
+    def _get_type_check(self, field: SchemaField) -> Optional[Callable[[str], bool]]:
+        """Return the value check for a field's data type, if it has one."""
+        if field.data_type == DataType.DATETIME:
+            return partial(self._is_valid_datetime, pattern=field.compiled_pattern)
+
+        type_checks: Dict[DataType, Callable[[str], bool]] = {
+            DataType.UUID: self._is_valid_uuid,
+            DataType.EMAIL: self._is_valid_email,
+            DataType.URL: self._is_valid_url,
+            DataType.JSON_ARRAY: self._is_valid_json_array,
+            DataType.JSON_OBJECT: self._is_valid_json_object,
+            DataType.INTEGER: self._is_valid_integer,
+            DataType.FLOAT: self._is_valid_float,
+            DataType.BOOLEAN: self._is_valid_boolean,
+        }
+        return type_checks.get(field.data_type)
 
     # Validation helper methods
     def _is_valid_uuid(self, value: str) -> bool:
         """Check if value is a valid UUID."""
+        if _CANONICAL_UUID_PATTERN.fullmatch(value) is not None:
+            return True
         try:
             uuid.UUID(value)
             return True
@@ -407,44 +677,43 @@ class CSVSchemaValidator:
 
     def _is_valid_email(self, value: str) -> bool:
         """Check if value is a valid email address."""
-        email_pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-        return bool(email_pattern.match(value))
+        return _EMAIL_PATTERN.match(value) is not None
 
     def _is_valid_url(self, value: str) -> bool:
         """Check if value is a valid URL."""
+        if _SIMPLE_URL_PATTERN.match(value) is not None:
+            return True
         try:
             result = urlparse(value)
             return all([result.scheme, result.netloc])
         except Exception:
             return False
 
-    def _is_valid_datetime(self, value: str, pattern: Optional[str] = None) -> bool:
+    def _is_valid_datetime(
+        self, value: str, pattern: Optional[Pattern[str]] = None
+    ) -> bool:
         """Check if value is a valid datetime."""
-        if pattern:
-            try:
-                return bool(re.match(pattern, value))
-            except re.error:
-                pass
-
-        # Try common datetime formats
-        common_formats = [
-            "%Y-%m-%d %H:%M:%S.%f",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%dT%H:%M:%S.%fZ",
-            "%Y-%m-%dT%H:%M:%SZ",
-        ]
+        if pattern is not None:
+            return bool(pattern.match(value))
 
-        for fmt in common_formats:
-            try:
-                datetime.strptime(value, fmt)
-                return True
-            except ValueError:
-                continue
+        # Every common format opens with a four-digit year and a dash; other
+        # values are rejected without raising inside strptime
+        if value[4:5] != "-" or not value[:4].isdecimal():
+            return False
 
-        return False
+        # strptime matches literals case-insensitively
+        fmt = _COMMON_DATETIME_FORMATS["T" in value or "t" in value, "." in value]
+        try:
+            datetime.strptime(value, fmt)
+            return True
+        except ValueError:
+            return False
 
     def _is_valid_json_array(self, value: str) -> bool:
         """Check if value is a valid JSON array."""
+        # Only a value opening with "[" can parse to a JSON array
+        if value.lstrip(_JSON_WHITESPACE)[:1] != "[":
+            return False
         try:
             parsed = json.loads(value)
             return isinstance(parsed, list)
@@ -453,6 +722,9 @@ class CSVSchemaValidator:
 
     def _is_valid_json_object(self, value: str) -> bool:
         """Check if value is a valid JSON object."""
+        # Only a value opening with "{" can parse to a JSON object
+        if value.lstrip(_JSON_WHITESPACE)[:1] != "{":
+            return False
         try:
             parsed = json.loads(value)
             return isinstance(parsed, dict)
@@ -461,6 +733,9 @@ class CSVSchemaValidator:
 
     def _is_valid_integer(self, value: str) -> bool:
         """Check if value is a valid integer."""
+        # Plain digit strings are always accepted by int(); skip the call
+        if value.isdecimal():
+            return True
         try:
             int(value)
             return True
@@ -477,7 +752,7 @@ class CSVSchemaValidator:
 
     def _is_valid_boolean(self, value: str) -> bool:
         """Check if value is a valid boolean."""
-        return value.lower() in ["true", "false"]
+        return value in _BOOLEAN_SPELLINGS or value.lower() in _BOOLEAN_WORDS
 
 
 class BatchValidator:
@@ -492,20 +767,24 @@ class BatchValidator:
         directory_path: Union[str, Path],
         schema_mapping: Dict[str, List[SchemaField]],
         file_patterns: Optional[Dict[str, str]] = None,
+        max_workers: Optional[int] = None,
     ) -> Dict[str, ValidationResult]:
         """
         Validate all CSV files in a directory using appropriate schemas.
 
+        Matching files are validated as one batch, in worker processes when
+        there are enough of them (see ``validate_files``).
+
         Args:
             directory_path: Directory containing CSV files
             schema_mapping: Dict mapping schema names to schema definitions
             file_patterns: Optional dict mapping schema names to file patterns
+            max_workers: Number of worker processes (defaults to the CPU count)
 
         Returns:
             Dict mapping file paths to validation results
         """
         directory_path = Path(directory_path)
-        results: Dict[str, ValidationResult] = {}
 
         if file_patterns is None:
             file_patterns = {
@@ -513,39 +792,135 @@ class BatchValidator:
                 "listing": "*Listing_rows*.csv",
             }
 
+        tasks: List[Tuple[str, List[SchemaField], str]] = []
         for schema_name, pattern in file_patterns.items():
             if schema_name not in schema_mapping:
                 continue
 
             schema = schema_mapping[schema_name]
-            validator = CSVSchemaValidator(schema)
-            validator.schema_name = schema_name
-
-            matching_files = list(directory_path.glob(pattern))
-
-            for file_path in matching_files:
-                result = validator.validate_file(file_path)
-                results[str(file_path)] = result
+            tasks.extend(
+                (str(file_path), schema, schema_name)
+                for file_path in directory_path.glob(pattern)
+            )
 
-        return results
+        return self._validate_batch(tasks, max_workers)
 
     def validate_files(
-        self, file_schema_pairs: List[Tuple[Union[str, Path], List[SchemaField]]]
+        self,
+        file_schema_pairs: List[Tuple[Union[str, Path], List[SchemaField]]],
+        max_workers: Optional[int] = None,
+        schema_name: str = "unknown",
     ) -> Dict[str, ValidationResult]:
         """
         Validate specific files with their respective schemas.
 
+        Files are independent, so batches of four or more are spread across
+        worker processes; smaller batches are validated in-process.
+
         Args:
             file_schema_pairs: List of (file_path, schema) pairs
+            max_workers: Number of worker processes (defaults to the CPU count)
+            schema_name: Name recorded on each validation result
 
         Returns:
             Dict mapping file paths to validation results
         """
-        results: Dict[str, ValidationResult] = {}
+        tasks = [
+            (str(file_path), schema, schema_name)
+            for file_path, schema in file_schema_pairs
+        ]
+        return self._validate_batch(tasks, max_workers)
+
+    def _validate_batch(
+        self,
+        tasks: List[Tuple[str, List[SchemaField], str]],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, ValidationResult]:
+        """Validate (file_path, schema, schema_name) tasks, in parallel if worthwhile."""
+        if not tasks:
+            return {}
+
+        # Files sharing a schema are validated by a single validator
+        groups: Dict[Tuple[int, str], Tuple[List[SchemaField], str, List[str]]] = {}
+        for file_path, schema, schema_name in tasks:
+            key = (id(schema), schema_name)
+            groups.setdefault(key, (schema, schema_name, []))[2].append(file_path)
 
-        for file_path, schema in file_schema_pairs:
-            validator = CSVSchemaValidator(schema)
-            result = validator.validate_file(file_path)
-            results[str(file_path)] = result
+        workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+        results: Dict[str, ValidationResult] = {}
 
-        return results
+        # Inside a worker process the caller is already parallel, so don't
+        # start another pool per worker
+        if (
+            len(tasks) < _PARALLEL_MIN_FILES
+            or workers == 1
+            or multiprocessing.parent_process() is not None
+        ):
+            for schema, schema_name, paths in groups.values():
+                results.update(zip(paths, _validate_files(paths, schema, schema_name)))
+        else:
+            chunksize = max(1, len(tasks) // (4 * workers))
+            chunks = [
+                (paths[start : start + chunksize], schema, schema_name)
+                for schema, schema_name, paths in groups.values()
+                for start in range(0, len(paths), chunksize)
+            ]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for (paths, _, _), chunk_results in zip(
+                    chunks, executor.map(_validate_files, *zip(*chunks))
+                ):
+                    results.update(zip(paths, chunk_results))
+
+        return {file_path: results[file_path] for file_path, _, _ in tasks}
+
+
+def _detect_encoding(file_path: Path) -> str:
+    """Pick the encoding to read a CSV file with from its first bytes."""
+    with open(file_path, "rb") as raw:
+        sample = raw.read(_ENCODING_SAMPLE_BYTES)
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        # Not final, so a character cut off at the end of the sample is fine
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return "latin-1"
+    return "utf-8"
+
+
+def _read_sample_lines(csvfile: TextIO) -> List[str]:
+    """Read whole lines from the start of a file for delimiter sniffing."""
+    lines: List[str] = []
+    size = 0
+    while size < _SNIFF_SAMPLE_CHARS:
+        line = csvfile.readline()
+        if not line:
+            break
+        lines.append(line)
+        size += len(line)
+    return lines
+
+
+def _sniff_delimiter(sample: str) -> str:
+    """Detect the delimiter of a CSV sample, falling back to a comma."""
+    try:
+        dialect = csv.Sniffer().sniff(
+            sample[:_SNIFF_MAX_CHARS], delimiters=_SNIFF_DELIMITERS
+        )
+    except csv.Error:
+        return ","
+    return dialect.delimiter
+
+
+def _validate_files(
+    paths: List[str], schema: List[SchemaField], schema_name: str = "unknown"
+) -> List[ValidationResult]:
+    """
+    Validate files that share a schema with one validator.
+
+    Module-level so worker processes can pickle it. A validator keeps no
+    per-file state, so it is safe to reuse across files.
+    """
+    validator = CSVSchemaValidator(schema)
+    validator.schema_name = schema_name
+    return [validator.validate_file(path) for path in paths]
@@ -0,0 +1,48 @@
+"""Tests for CSV schema validation."""
+
+from datetime import datetime
+from pathlib import Path
+
+from csv_schema_validator import (
+    CSVSchemaValidator,
+    DataType,
+    SchemaField,
+    ValidationIssue,
+    ValidationResult,
+)
+
+
+def test_duplicated_header_checks_last_column_only(tmp_path: Path) -> None:
+    """A repeated column name is validated once, using its last column."""
+    csv_path = tmp_path / "duplicated.csv"
+    csv_path.write_text("id,id\nnot-a-number,5\n7,also-bad\n", encoding="utf-8")
+
+    validator = CSVSchemaValidator([SchemaField("id", DataType.INTEGER)])
+    result = validator.validate_file(csv_path)
+
+    assert [(issue.row_number, issue.actual_value) for issue in result.issues] == [
+        (3, "also-bad")
+    ]
+
+
+def test_severity_counts_follow_later_issue_changes() -> None:
+    """Issues added after the counts were first read are still counted."""
+    result = ValidationResult(
+        file_path="data.csv",
+        schema_name="test",
+        is_valid=False,
+        total_rows=1,
+        total_columns=1,
+        issues=[ValidationIssue("id", "invalid_integer", "error", "bad")],
+        missing_columns=[],
+        extra_columns=[],
+        validation_timestamp=datetime.now(),
+        execution_time_ms=0.0,
+    )
+    assert (result.error_count, result.warning_count) == (1, 0)
+
+    result.issues.append(ValidationIssue("id", "extra_column", "warning", "extra"))
+    assert (result.error_count, result.warning_count) == (1, 1)
+
+    result.issues = []
+    assert (result.error_count, result.warning_count) == (0, 0)